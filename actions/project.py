@@ -1,5 +1,6 @@
 import re
 import asyncio
+from typing import Optional
 
 from discord.ui import Button, View
 from core.db.aws_project import AWSProject
@@ -7,12 +8,78 @@ from core.db.project import Project, projectFromCursor
 from core.discord import Discord
 from core.env import WEBHOOK_HOST
 from core.logger import getLogger
+from core.teardown import ProgressCallback
 from helpers.gitlab import GitlabClient
 from notification_templates import get_notification_message
 from user_link import UserLink
 
 # Set up logging
 logger = getLogger('discord-actions:project')
+
+WAR_ROOM_CHANNEL_NAME = "WAR ROOM"
+CODE_REVIEW_CHANNEL_NAME = "CODE REVIEW"
+
+# Eventos do webhook: deployments disparam o refresh da dashboard (state_change_reason)
+WEBHOOK_EVENTS = ('push_events', 'pipeline_events', 'merge_requests_events', 'deployment_events')
+
+
+def project_group_name(gitlab_project) -> str:
+    return gitlab_project.namespace['name'] if gitlab_project.namespace['kind'] == 'group' else "OTHER"
+
+
+async def ensure_project_webhook(gitlab_project, token):
+    """Registra o webhook do bot no projeto GitLab, ou liga os eventos que faltam num webhook existente."""
+    webhook_url = f"{WEBHOOK_HOST}/webhook/{gitlab_project.id}"
+    logger.info(f"webhook_url: {webhook_url}")
+
+    try:
+        # Verificar se já existe um webhook com a mesma URL (todas as páginas)
+        existing_hooks = await asyncio.to_thread(gitlab_project.hooks.list, get_all=True)
+        for hook in existing_hooks:
+            if hook.url == webhook_url:
+                logger.info(f"Webhook already exists for URL: {webhook_url}")
+                # Webhooks antigos não recebiam deployments (usados no refresh das dashboards)
+                missing = [event for event in WEBHOOK_EVENTS if not getattr(hook, event, False)]
+                if missing:
+                    for event in missing:
+                        setattr(hook, event, True)
+                    await asyncio.to_thread(hook.save)
+                    logger.info(f"Enabled {', '.join(missing)} on webhook {hook.id}")
+                return  # Sai da função se o webhook já existir
+
+        await asyncio.to_thread(gitlab_project.hooks.create, {
+            'url': webhook_url,
+            **{event: True for event in WEBHOOK_EVENTS},
+            'token': token,
+            'enable_ssl_verification': False
+        })
+
+        logger.info(f"Set up webhook for project {gitlab_project.name}")
+    except Exception as e:
+        logger.error(f"Failed to create webhook: {str(e)}")
+        raise Exception(f"Failed to set up webhook (url: {webhook_url}): {str(e)}")
+
+
+async def sync_project_webhooks():
+    """
+    Roda ensure_project_webhook em todos os projetos cadastrados, para que webhooks
+    criados antes de WEBHOOK_EVENTS (ex.: sem deployment_events) passem a receber tudo.
+    """
+    try:
+        gl = await GitlabClient.create()
+    except Exception as e:
+        logger.warning(f"Skipping webhook sync: {e}")
+        return
+
+    for row in await Project().get_projects():
+        project_id = row[0]
+        try:
+            gitlab_project = await asyncio.to_thread(gl.instance.projects.get, project_id)
+            await ensure_project_webhook(gitlab_project, gl.token)
+        except Exception as e:
+            logger.error(f"Failed to sync webhook of project {project_id}: {e}")
+
+
 class ProjectActions:
 
     guild = None
@@ -58,7 +125,7 @@ class ProjectActions:
         # Set Project and Discord properties  
         self.gitlab_project = gitlab_project_data
 
-        group_name = gitlab_project_data.namespace['name'] if gitlab_project_data.namespace['kind'] == 'group' else "OTHER"
+        group_name = project_group_name(gitlab_project_data)
         project_url = gitlab_project_data.web_url
         
         if not self.category_name:
@@ -72,8 +139,8 @@ class ProjectActions:
             self.notification_channel_name = _[1] if _ else gitlab_project_data.path
         
         self.notification_channel = await self.discord.addTextChannel(self.notification_channel_name, self.category_name)
-        self.war_room_channel = await self.discord.addVoiceChannel("WAR ROOM", self.category_name)
-        self.code_review_channel = await self.discord.addVoiceChannel("CODE REVIEW", self.category_name)
+        self.war_room_channel = await self.discord.addVoiceChannel(WAR_ROOM_CHANNEL_NAME, self.category_name)
+        self.code_review_channel = await self.discord.addVoiceChannel(CODE_REVIEW_CHANNEL_NAME, self.category_name)
 
         if _ is None:
             _ = [
@@ -96,8 +163,8 @@ class ProjectActions:
         logger.info(f"--------------------------------------------------- setupDiscord ---------------------------------------------------")
         if self.category_channel is None:
             self.category_channel = await self.discord.addCategory(self.category_name)
-            await self.discord.addVoiceChannel("WAR ROOM", self.category_name)
-            await self.discord.addVoiceChannel("CODE REVIEW", self.category_name)
+            await self.discord.addVoiceChannel(WAR_ROOM_CHANNEL_NAME, self.category_name)
+            await self.discord.addVoiceChannel(CODE_REVIEW_CHANNEL_NAME, self.category_name)
 
         if not self.notification_channel:
             self.notification_channel = await self.discord.addTextChannel(self.notification_channel_name, self.category_name)
@@ -117,32 +184,8 @@ class ProjectActions:
 
     async def setupGitlab(self):
         logger.info(f"--------------------------------------------------- setupGitlab ---------------------------------------------------")
-        # Set up webhook for the project
-        webhook_url = f"{WEBHOOK_HOST}/webhook/{self.gitlab_project.id}"
         logger.info(f"WEBHOOK_HOST: {WEBHOOK_HOST}")
-        logger.info(f"webhook_url: {webhook_url}")
-
-        try:
-            # Verificar se já existe um webhook com a mesma URL
-            existing_hooks = await asyncio.to_thread(self.gitlab_project.hooks.list)
-            for hook in existing_hooks:
-                if hook.url == webhook_url:
-                    logger.info(f"Webhook already exists for URL: {webhook_url}")
-                    return  # Sai da função se o webhook já existir
-
-            self.gitlab_project.hooks.create({
-                'url': webhook_url,
-                'push_events': True,
-                'pipeline_events': True,
-                'merge_requests_events': True,
-                'token': self.gl.token,
-                'enable_ssl_verification': False
-            })
-
-            logger.info(f"Set up webhook for project {self.gitlab_project.name}")
-        except Exception as e:
-            logger.error(f"Failed to create webhook: {str(e)}")
-            raise Exception(f"Failed to set up webhook (url: {webhook_url}): {str(e)}")
+        await ensure_project_webhook(self.gitlab_project, self.gl.token)
 
     async def add(self, project_id: int = None, project_name: str = None, project_group: str = None):
         logger.info('Add project command triggered')
@@ -187,18 +230,20 @@ class ProjectActions:
         )
         
 
-    async def remove(self):
+    async def remove(self, on_progress: Optional[ProgressCallback] = None):
         logger.info(f'Remove project command triggered for project ID: {self.gitlab_project.id}')
 
         if self.gitlab_project and self.project:
-            self.db.remove_project(self.gitlab_project.id)
-            self.discord.removeChannel(self.project.channel_id)
+            await self.db.remove_project(self.gitlab_project.id)
+            # Ids vêm como texto do banco; string seria buscada como nome do canal
+            await self.discord.removeChannel(int(self.project.channel_id), on_progress=on_progress)
 
-        if self.discord.getCategoryChannelsCount(self.category.id, "text") == 0:
-            self.discord.removeCategory(self.category.id)
+        counts = await self.discord.getCategoryChannelsCount(self.category_channel.id, "text")
+        if counts.get('text', 0) == 0:
+            await self.discord.removeCategory(self.category_channel.id, on_progress=on_progress)
 
         if self.project.thread_id:
-            self.discord.archiveForumThread(self.project.thread_id)
+            await self.discord.archiveForumThread(int(self.project.thread_id))
             
         
         webhooks = self.gitlab_project.hooks.list()
@@ -218,6 +263,9 @@ class ProjectActions:
             await self.handle_issue(data)
         elif event_type == 'Pipeline Hook':
             await self.handle_pipeline(data)
+        elif event_type == 'Deployment Hook':
+            # Sem notificação: só dispara o refresh da dashboard (publicado em gitlab_webhook)
+            pass
         else:
             logger.warning(f"Unhandled event type: {event_type}")
 
@@ -0,0 +1,213 @@
+import re
+import time
+import asyncio
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from actions.project import (
+    CODE_REVIEW_CHANNEL_NAME,
+    WAR_ROOM_CHANNEL_NAME,
+    ensure_project_webhook,
+    project_group_name,
+)
+from core.db.project import Project, projectFromCursor
+from core.discord import Discord
+from core.logger import getLogger
+from helpers.gitlab import GitlabClient
+from helpers.rate_limit import RateLimiter, discord_create_limiter
+
+logger = getLogger('discord-actions:project-bulk')
+
+ProgressCallback = Callable[[str], Awaitable[None]]
+
+# Chamadas simultâneas à API do GitLab (python-gitlab é síncrono, roda em threads)
+GITLAB_CONCURRENCY = 8
+
+
+@dataclass
+class PlannedProject:
+    gitlab_project: object
+    category_name: str
+    channel_name: str
+
+
+@dataclass
+class OnboardingReport:
+    requested: int = 0
+    added: List[str] = field(default_factory=list)
+    failures: List[Tuple[str, str]] = field(default_factory=list)
+    categories: int = 0
+    channels: int = 0
+    elapsed: float = 0.0
+
+    def summary(self) -> str:
+        lines = [
+            f"✅ {len(self.added)}/{self.requested} projetos adicionados em {self.elapsed:.1f}s "
+            f"({self.categories} categorias, {self.channels} canais)."
+        ]
+        if self.failures:
+            lines.append(f"❌ {len(self.failures)} falha(s):")
+            lines.extend(f"- {name}: {error}" for name, error in self.failures[:20])
+            if len(self.failures) > 20:
+                lines.append(f"- ... e mais {len(self.failures) - 20}")
+        return "\n".join(lines)
+
+
+def parse_project_ids(value: str) -> Optional[List[int]]:
+    """Retorna os IDs se `value` for uma lista de números, ou None se for um caminho de grupo."""
+    tokens = [token for token in re.split(r'[\s,;]+', value.strip()) if token]
+    if tokens and all(token.isdigit() for token in tokens):
+        return list(dict.fromkeys(int(token) for token in tokens))
+    return None
+
+
+class BulkProjectActions:
+    """
+    Onboards many GitLab projects at once.
+
+    GitLab metadata is fetched concurrently, the union of categories and
+    channels needed by all projects is planned up front and provisioned in
+    rate-limited batches (categories first, then channels), and webhooks are
+    registered concurrently at the end.
+    """
+
+    def __init__(self, guild, on_progress: Optional[ProgressCallback] = None, limiter: RateLimiter = None):
+        self.guild = guild
+        self.discord = Discord(guild)
+        self.db = Project()
+        self.gl = None
+        self.on_progress = on_progress
+        self.limiter = limiter or discord_create_limiter()
+        self._gitlab_semaphore = asyncio.Semaphore(GITLAB_CONCURRENCY)
+
+    async def add(self, projects: str) -> OnboardingReport:
+        """
+        Parameters:
+            projects (str): Project IDs separated by commas/spaces, or a GitLab group path.
+        """
+        started = time.monotonic()
+        report = OnboardingReport()
+
+        if self.gl is None:
+            self.gl = await GitlabClient.create()
+
+        project_ids = parse_project_ids(projects)
+        if project_ids is None:
+            await self._progress(f"🔎 Listando projetos do grupo `{projects}`...")
+            project_ids = await self._group_project_ids(projects.strip())
+
+        report.requested = len(project_ids)
+        await self._progress(f"📥 Buscando {len(project_ids)} projetos no GitLab...")
+        gitlab_projects = await self._fetch_projects(project_ids, report)
+
+        plan = await self._plan(gitlab_projects)
+        await self._progress(f"🏗️ Criando canais para {len(plan)} projetos...")
+        categories, channels = await self._provision(plan, report)
+
+        await self._progress(f"🔗 Registrando {len(plan)} projetos e webhooks...")
+        await asyncio.gather(*(self._register(item, categories, channels, report) for item in plan))
+
+        report.elapsed = time.monotonic() - started
+        logger.info(report.summary())
+        return report
+
+    async def _progress(self, message: str):
+        if self.on_progress is None:
+            return
+        try:
+            await self.on_progress(message)
+        except Exception as e:
+            logger.warning(f"Progress callback failed: {e}")
+
+    async def _gitlab(self, func, *args, **kwargs):
+        async with self._gitlab_semaphore:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def _group_project_ids(self, group_path: str) -> List[int]:
+        group = await self._gitlab(self.gl.instance.groups.get, group_path)
+        projects = await self._gitlab(group.projects.list, all=True, include_subgroups=True, archived=False)
+        return [project.id for project in projects]
+
+    async def _fetch_projects(self, project_ids: List[int], report: OnboardingReport) -> list:
+        results = await asyncio.gather(
+            *(self._gitlab(self.gl.instance.projects.get, project_id) for project_id in project_ids),
+            return_exceptions=True
+        )
+
+        gitlab_projects = []
+        for project_id, result in zip(project_ids, results):
+            if isinstance(result, Exception):
+                report.failures.append((str(project_id), f"GitLab: {result}"))
+            else:
+                gitlab_projects.append(result)
+        return gitlab_projects
+
+    async def _plan(self, gitlab_projects: list) -> List[PlannedProject]:
+        plan = []
+        for gitlab_project in gitlab_projects:
+            existing = await self.db.get_project(gitlab_project.id)
+            channel_name = projectFromCursor(existing).name if existing else gitlab_project.path
+            plan.append(PlannedProject(
+                gitlab_project=gitlab_project,
+                category_name=project_group_name(gitlab_project).upper(),
+                channel_name=channel_name
+            ))
+        return plan
+
+    async def _provision(self, plan: List[PlannedProject], report: OnboardingReport) -> Tuple[Dict, Dict]:
+        category_names = sorted({item.category_name for item in plan})
+        categories = dict(zip(category_names, await asyncio.gather(
+            *(self._limited(self.discord.addCategory(name)) for name in category_names),
+            return_exceptions=True
+        )))
+
+        # Canais de texto de cada projeto + salas de voz de cada categoria, sem repetições
+        wanted = {(item.category_name, 'text', item.channel_name) for item in plan}
+        for name in category_names:
+            wanted.add((name, 'voice', WAR_ROOM_CHANNEL_NAME))
+            wanted.add((name, 'voice', CODE_REVIEW_CHANNEL_NAME))
+        wanted = sorted(key for key in wanted if not isinstance(categories[key[0]], Exception))
+
+        created = await asyncio.gather(
+            *(self._limited(self._add_channel(kind, name, category_name)) for category_name, kind, name in wanted),
+            return_exceptions=True
+        )
+        channels = dict(zip(wanted, created))
+
+        report.categories = sum(1 for c in categories.values() if not isinstance(c, Exception))
+        report.channels = sum(1 for c in channels.values() if not isinstance(c, Exception))
+        return categories, channels
+
+    async def _add_channel(self, kind: str, name: str, category_name: str):
+        if kind == 'voice':
+            return await self.discord.addVoiceChannel(name, category_name)
+        return await self.discord.addTextChannel(name, category_name)
+
+    async def _limited(self, coro):
+        async with self.limiter:
+            return await coro
+
+    async def _register(self, item: PlannedProject, categories: Dict, channels: Dict, report: OnboardingReport):
+        gitlab_project = item.gitlab_project
+        category = categories.get(item.category_name)
+        channel = channels.get((item.category_name, 'text', item.channel_name))
+
+        for resource in (category, channel):
+            if resource is None or isinstance(resource, Exception):
+                report.failures.append((gitlab_project.path_with_namespace, f"Discord: {resource}"))
+                return
+
+        try:
+            await self.db.set_project(
+                gitlab_project.id,
+                item.channel_name,
+                item.category_name,
+                channel.id,
+                category.id,
+                gitlab_project.web_url
+            )
+            async with self._gitlab_semaphore:
+                await ensure_project_webhook(gitlab_project, self.gl.token)
+            report.added.append(gitlab_project.path_with_namespace)
+        except Exception as e:
+            report.failures.append((gitlab_project.path_with_namespace, str(e)))
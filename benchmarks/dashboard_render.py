@@ -0,0 +1,226 @@
+"""
+Benchmark da geração de dashboards (DashboardCog.generate_dashboard_image).
+
+Roda offline: projetos e ambientes sintéticos, AWSResourceManager substituído por
+um stub e a RenderCache desligada, para que toda iteração renderize de verdade.
+
+Uso:
+    python -m benchmarks.dashboard_render --backend all --environments 4 --iterations 50 \\
+        --output benchmark-results.json
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.db.DB import DotDict
+from services.dashboard.config import AWSStatusConfig, RenderCacheConfig, RendererConfig, RenderWorkerConfig
+from services.dashboard.render_cache import RenderCache
+from services.dashboard.renderer import create_renderer
+from services.dashboard.status import AWSStatusCollector
+
+BACKENDS = ('pillow', 'playwright')
+STATUSES = ('success', 'running', 'failed')
+
+
+class StubResourceManager:
+    """Responde como AWSResourceManager.get_services_info, sem rede (uma latência por cluster)."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+
+    def get_services_info(self, cluster_name, service_names):
+        if self.latency:
+            time.sleep(self.latency)
+        return {service_name: self.service_info(cluster_name, service_name) for service_name in service_names}
+
+    def service_info(self, cluster_name, service_name):
+        self.calls += 1
+        return {
+            'cluster': cluster_name,
+            'service': service_name,
+            'status': STATUSES[self.calls % len(STATUSES)],
+            # Muda a cada chamada, como uma dashboard com deploys frequentes
+            'last_update': datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=self.calls),
+            'running_count': 1 + self.calls % 3,
+            'cpu_usage': round(20 + 15 * math.sin(self.calls / 5), 2),
+            'memory_usage': round(55 + 10 * math.cos(self.calls / 7), 2),
+        }
+
+
+class StubStatusCollector(AWSStatusCollector):
+    def __init__(self, latency: float, metrics=None):
+        super().__init__(AWSStatusConfig(workers=8, timeout=30), metrics=metrics)
+        self.stub = StubResourceManager(latency)
+
+    def _manager(self, aws_project):
+        return self.stub
+
+
+def synthetic_project(index: int):
+    return DotDict({'id': index, 'name': f'project-{index}', 'group_id': index, 'repository_url': '#'})
+
+
+def synthetic_environments(project_id: int, count: int):
+    names = ('production', 'staging', 'homolog', 'develop', 'qa', 'sandbox')
+    return [
+        DotDict({
+            'id': project_id,
+            'environment': names[i % len(names)] + (str(i // len(names)) if i >= len(names) else ''),
+            # Um cluster por ambiente, compartilhado pelos projetos (como numa conta real)
+            'cluster_name': f'cluster-{i}',
+            'service_name': f'project-{project_id}-service-{i}',
+            'aws_access_key': 'AKIA-BENCHMARK',
+            'aws_secret_key': 'benchmark',
+            'aws_region': 'sa-east-1',
+        })
+        for i in range(count)
+    ]
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss é em KB no Linux e em bytes no macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def browser_rss_mb() -> float:
+    from services.dashboard.browser_pool import process_tree_rss
+    return round(process_tree_rss() / (1024 * 1024), 1)
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL,
+                                       cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+async def run_backend(backend: str, args) -> dict:
+    from cogs.dashboard import DashboardCog, DashboardContext
+
+    bot = mock.Mock(guilds=[])
+    cog = DashboardCog(bot)
+    await cog.renderer.close()
+    cog.status_collector.close()
+
+    cog.renderer = create_renderer(replace(RendererConfig.from_env(), backend=backend),
+                                   image_config=cog.image_processor.config,
+                                   worker_config=RenderWorkerConfig(workers=args.workers))
+    cog.render_cache = RenderCache(RenderCacheConfig(max_memory_mb=0))
+    # Sparklines entram no card como em produção; sem intervalo, toda iteração acrescenta uma amostra
+    cog.metric_store.config.sample_interval = 0
+    cog.status_collector = StubStatusCollector(args.aws_latency_ms / 1000, metrics=cog.metric_store)
+
+    projects = [synthetic_project(i) for i in range(args.projects)]
+    contexts = [
+        DashboardContext(category=DotDict({'id': i, 'name': f'CATEGORY-{i}'}),
+                         projects=tuple(projects[start:start + args.category_size]))
+        for i, start in enumerate(range(0, len(projects), args.category_size))
+    ]
+    environments = {project.id: synthetic_environments(project.id, args.environments) for project in projects}
+
+    async def get_aws_projects(self, environment=None, project_id=None):
+        return environments[project_id]
+
+    latencies = []
+    output_bytes = []
+    peak_browser = 0.0
+    try:
+        with mock.patch('cogs.dashboard.AWSProject.get_aws_projects', get_aws_projects):
+            for iteration in range(args.warmup + args.iterations):
+                context = contexts[iteration % len(contexts)]
+                started = time.perf_counter()
+                dashboard_file = await cog.generate_dashboard_image(context)
+                elapsed = (time.perf_counter() - started) * 1000
+
+                if iteration >= args.warmup:
+                    latencies.append(elapsed)
+                    output_bytes.append(len(dashboard_file.fp.getvalue()))
+                if backend == 'playwright' and iteration % 10 == 0:
+                    peak_browser = max(peak_browser, browser_rss_mb())
+    finally:
+        await cog.renderer.close()
+        cog.status_collector.close()
+
+    return {
+        'backend': backend,
+        'workers': args.workers,
+        'projects': args.projects,
+        'category_size': args.category_size,
+        'environments': args.environments,
+        'iterations': args.iterations,
+        'p50_ms': round(percentile(latencies, 0.50), 2),
+        'p95_ms': round(percentile(latencies, 0.95), 2),
+        'mean_ms': round(sum(latencies) / len(latencies), 2),
+        'max_ms': round(max(latencies), 2),
+        'peak_rss_mb': peak_rss_mb(),
+        'peak_browser_rss_mb': peak_browser,
+        'output_bytes': round(sum(output_bytes) / len(output_bytes)),
+        'image_format': cog.image_processor.extension,
+    }
+
+
+async def main(args) -> dict:
+    backends = BACKENDS if args.backend == 'all' else (args.backend,)
+    results = []
+    for backend in backends:
+        try:
+            result = await run_backend(backend, args)
+        except Exception as e:
+            # Ex.: Chromium não instalado — o resultado registra o erro e os demais backends seguem
+            result = {'backend': backend, 'error': f'{type(e).__name__}: {str(e).splitlines()[0]}'}
+        results.append(result)
+        print(json.dumps(result))
+
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'aws_latency_ms': args.aws_latency_ms,
+        'results': results,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--backend', choices=('all', *BACKENDS), default='all')
+    parser.add_argument('--projects', type=int, default=5, help='projetos sintéticos (categorias renderizadas em rodízio)')
+    parser.add_argument('--environments', type=int, default=4, help='ambientes por projeto')
+    parser.add_argument('--category-size', type=int, default=1,
+                        help='projetos por categoria (cada dashboard composta renderiza todos)')
+    parser.add_argument('--workers', type=int, default=0, help='processos de renderização (0 = no próprio processo)')
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--warmup', type=int, default=3, help='iterações descartadas (ex.: início do Chromium)')
+    parser.add_argument('--aws-latency-ms', type=float, default=0, help='latência simulada de cada chamada AWS')
+    parser.add_argument('--output', help='arquivo JSON com os resultados')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    arguments = parse_args()
+    report = asyncio.run(main(arguments))
+    if arguments.output:
+        with open(arguments.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Resultados salvos em {arguments.output}")
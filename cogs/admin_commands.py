@@ -1,14 +1,17 @@
-import asyncio
 import discord
+from datetime import datetime
 from discord import app_commands, AllowedMentions
 from typing import Optional
 
 from actions.project import ProjectActions
+from actions.project_bulk import BulkProjectActions
 from core.cogs.commands_cog import CommandsCog
 from core.db.gitlab import Gitlab
 from core.db.project import Project
+from core.purge import PurgeEngine
 from helpers.chunk import markdown_aware_chunk
 from helpers.cog import need_admin_permissions
+from helpers.interaction_progress import InteractionProgress
 from helpers.messages import HELP_MESSAGE_CONTENT
 from helpers.utils import response_list
 
@@ -19,8 +22,12 @@ class AdminCommands(CommandsCog):
         self.gitlab = Gitlab()
 
     @app_commands.command(name='limpar', description="Limpa mensagens do canal")
+    @app_commands.describe(
+        amount="Número de mensagens (1 a 100) ou 'tudo'",
+        since="Com 'tudo': apaga apenas mensagens a partir desta data (DD/MM/AAAA)"
+    )
     @need_admin_permissions()
-    async def clear(self, interaction: discord.Interaction, amount: Optional[str] = None):
+    async def clear(self, interaction: discord.Interaction, amount: Optional[str] = None, since: Optional[str] = None):
         await interaction.response.defer(ephemeral=True)
         channel = interaction.channel
 
@@ -29,20 +36,30 @@ class AdminCommands(CommandsCog):
             return
 
         if amount.lower() in ("all", "tudo"):
-            await interaction.followup.send("Iniciando a limpeza de todas as mensagens. Isso pode levar algum tempo...")
+            after = None
+            if since:
+                try:
+                    after = datetime.strptime(since, "%d/%m/%Y").astimezone()
+                except ValueError:
+                    await interaction.followup.send('Data inválida. Use o formato DD/MM/AAAA.')
+                    return
+
+            progress = await InteractionProgress.start(
+                interaction, "🧹 Iniciando a limpeza das mensagens. Isso pode levar algum tempo..."
+            )
+
+            async def on_progress(report):
+                await progress.update(report.summary())
 
             try:
-                while True:
-                    deleted = await channel.purge(limit=100)
-                    if len(deleted) < 100:
-                        break
-                    await asyncio.sleep(1)
+                report = await PurgeEngine(channel, after=after, on_progress=on_progress).run()
             except discord.errors.Forbidden:
-                await interaction.followup.send("Não tenho permissão para apagar mensagens neste canal.")
+                await progress.finish("Não tenho permissão para apagar mensagens neste canal.")
             except Exception as e:
-                await interaction.followup.send(f"Ocorreu um erro: {str(e)}")
+                await progress.finish(f"Ocorreu um erro: {str(e)}")
             else:
-                await interaction.followup.send("Limpeza concluída. Todas as mensagens recentes foram apagadas.")
+                await progress.finish(report.summary())
+                self.logger.info(f'Limpeza de #{channel} concluída: {report.deleted}/{report.scanned} mensagens')
             return
 
         try:
@@ -87,6 +104,27 @@ class AdminCommands(CommandsCog):
         await interaction.response.send_message(f"Projeto {project_id} adicionado com sucesso!")
         self.logger.info(f'Projeto {project_id} adicionado com sucesso')
 
+    @app_commands.command(name='add_projects', description="Adiciona vários projetos de uma vez")
+    @app_commands.describe(projects="IDs separados por vírgula/espaço ou o caminho de um grupo do GitLab")
+    @need_admin_permissions()
+    async def add_projects(self, interaction: discord.Interaction, projects: str):
+        if not interaction.guild:
+            await interaction.response.send_message("Este comando só pode ser usado em servidores.")
+            return
+
+        await interaction.response.defer()
+        progress = await InteractionProgress.start(interaction, "⏳ Iniciando a adição dos projetos...")
+
+        try:
+            report = await BulkProjectActions(interaction.guild, on_progress=progress.update).add(projects)
+        except Exception as e:
+            await progress.finish(f"❌ Erro ao adicionar projetos: {str(e)}")
+            self.logger.error(f'Erro ao adicionar projetos ({projects}): {e}')
+            return
+
+        await progress.finish(report.summary())
+        self.logger.info(f'{len(report.added)}/{report.requested} projetos adicionados ({projects})')
+
     @app_commands.command(name='remove_project', description="Remove um projeto existente")
     @need_admin_permissions()
     async def remove_project(self, interaction: discord.Interaction, project_id: int):
@@ -94,11 +132,22 @@ class AdminCommands(CommandsCog):
             await interaction.response.send_message("Este comando só pode ser usado em servidores.")
             return
 
-        project = ProjectActions(interaction.guild)
-        await project.load(project_id)
-        await project.remove()
+        await interaction.response.defer()
+        progress = await InteractionProgress.start(interaction, f"🧹 Removendo o projeto {project_id}...")
+
+        async def on_progress(done, total):
+            await progress.update(f"🧹 Removendo o projeto {project_id}: {done}/{total} itens...")
+
+        try:
+            project = ProjectActions(interaction.guild)
+            await project.load(project_id)
+            await project.remove(on_progress=on_progress)
+        except Exception as e:
+            await progress.finish(f"❌ Erro ao remover o projeto {project_id}: {str(e)}")
+            self.logger.error(f'Erro ao remover o projeto {project_id}: {e}')
+            return
 
-        await interaction.response.send_message(f"Projeto {project_id} removido com sucesso!")
+        await progress.finish(f"Projeto {project_id} removido com sucesso!")
         self.logger.info(f'Projeto {project_id} removido com sucesso')
 
     @app_commands.command(name='show_config', description="Mostra a configuração atual do GitLab e projetos")
@@ -121,7 +170,7 @@ class AdminCommands(CommandsCog):
             project_id, project_name, project_group, *other_values = project
             config_message += f"- {project_group.upper()} > {project_name}\n"
 
-        await interaction.response.send_message(config_message)
+        await response_list(interaction, [config_message], ephemeral=False, static=False)
 
 
 # Setup da cog
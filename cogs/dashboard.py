@@ -2,28 +2,33 @@ import discord
 from discord import app_commands
 import asyncio
 import pytz
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from datetime import timezone
+from typing import Optional, Tuple
 from configs.constants import DASHBOARD_CHANNEL_NAME
-from core.aws_resource_manager import AWSResourceManager
 from core.cogs.commands_cog import CommandsCog
 from core.db.aws_project import AWSProject
+from core.db.dashboard import Dashboard
 from core.db.project import Project, projectFromCursor
 from core.discord import Discord
+from core.events import events, PROJECT_STATE_CHANGED, ProjectStateChanged
 from helpers.datetime import format_date
+from helpers.message_diff import content_hash, edit_if_changed, forget, last_hash, remember
+from helpers.single_flight import SingleFlight
 from core.emoji import status_emoji
-from jinja2 import Template
 from io import BytesIO
-from playwright.async_api import async_playwright
-import os
+from services.dashboard.model import DashboardCard, EnvironmentStatus, ProjectStatus
+from services.dashboard.image import ImageProcessor
+from services.dashboard.metrics import CPU, MEMORY, RUNNING, MetricStore, series_key
+from services.dashboard.render_cache import RenderCache, render_key
+from services.dashboard.renderer import create_renderer
+from services.dashboard.scheduler import DashboardScheduler
+from services.dashboard.status import AWSStatusCollector
 
 from helpers.project_auto_complete import project_autocomplete
 
-# Update the paths to use the project root directory
-current_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.dirname(current_dir)
-
-overviewPath = os.path.join(project_root, 'templates', 'overview.html')
-projectItemPath = os.path.join(project_root, 'templates', 'partials', 'project-info.html')
+# "Thread is archived": edições em threads arquivadas são recusadas
+THREAD_ARCHIVED_ERROR = 50083
 
 
 class DashboardView(discord.ui.View):
@@ -45,8 +50,28 @@ class DashboardView(discord.ui.View):
 class DashboardCog(CommandsCog):
     def __init__(self, bot):
         super().__init__(bot, logger_tag='dashboard')
-        self.dashboard_posts = {}
         self.discord = None
+        self.dashboards_adopted = False
+        self.image_processor = ImageProcessor()
+        # Com workers, a quantização/codificação roda nos processos de renderização com esta mesma configuração
+        self.renderer = create_renderer(image_config=self.image_processor.config)
+        self.render_cache = RenderCache(extension=self.image_processor.extension)
+        self.metric_store = MetricStore()
+        self.status_collector = AWSStatusCollector(metrics=self.metric_store)
+        # Atualizações em andamento por thread de dashboard (categoria)
+        self.dashboard_flight = SingleFlight()
+        self.scheduler = DashboardScheduler(self.dashboard_jobs, self.refresh_dashboard, key=lambda job: job.category.id)
+
+    async def cog_load(self):
+        self.scheduler.start(wait_until=self.bot.wait_until_ready)
+        events.subscribe(PROJECT_STATE_CHANGED, self.on_project_state_changed)
+
+    async def cog_unload(self):
+        events.unsubscribe(PROJECT_STATE_CHANGED, self.on_project_state_changed)
+        await self.scheduler.stop()
+        await self.renderer.close()
+        self.status_collector.close()
+        await asyncio.to_thread(self.metric_store.snapshot)
 
     async def get_discord(self):
         """Lazy initialization do Discord helper"""
@@ -60,12 +85,19 @@ class DashboardCog(CommandsCog):
     async def getProject(self, project_id: int = None):
         _ = Project()
         cursor = await _.get_project(project_id)
-        if cursor:
-            self.project = projectFromCursor(cursor)
-        else:
+        if not cursor:
             raise Exception(f"Project with ID {project_id} not found.")
 
-        return self.project
+        return projectFromCursor(cursor)
+
+    async def build_context(self, project, forum_channel=None) -> 'DashboardContext':
+        discord_helper = await self.get_discord()
+        category = await discord_helper.getCategory(int(project.group_id))
+        if category is None:
+            raise Exception(f"Category {project.group_id} of project {project.name} not found.")
+        # A dashboard é da categoria: entram todos os projetos dela
+        projects = await Project().get_projects_by_group_id(category.id) or [project]
+        return DashboardContext(category=category, projects=tuple(projects), forum_channel=forum_channel)
 
     def get_ecs_status_emoji(self, service_status):
         """
@@ -117,25 +149,24 @@ class DashboardCog(CommandsCog):
         forum_channel = discord.utils.get(guild.forums, name=DASHBOARD_CHANNEL_NAME)
 
         try:
-            await self.getProject(project_id)
+            project = await self.getProject(project_id)
         except Exception as e:
             await interaction.followup.send(
                 f"❌ Projeto ID {project_id} não encontrado. Use o autocomplete para selecionar um projeto válido.",
                 ephemeral=True)
             return
 
-        project_name = self.project.name
-        project_url = getattr(self.project, 'repository_url', '#')
+        project_name = project.name
 
         if not forum_channel:
             await interaction.followup.send(f"No '{DASHBOARD_CHANNEL_NAME}' forum channel found. Creating for u...")
-            forum_channel = await guild.create_forum(
-                name=DASHBOARD_CHANNEL_NAME,
-                reason="Dashboard forum channel creation"
-            )
+            # Single-flight: comandos simultâneos criam um único fórum
+            discord_helper = await self.get_discord()
+            forum_channel = await discord_helper.addForumChannel(DASHBOARD_CHANNEL_NAME)
 
         try:
-            dashboard_image = await self.generate_dashboard_image()
+            context = await self.build_context(project, forum_channel)
+            result = await self.update_dashboard(context, create=True)
         except FileNotFoundError:
             await interaction.followup.send("Error: Template files not found. Please check the file paths.")
             return
@@ -143,208 +174,362 @@ class DashboardCog(CommandsCog):
             await interaction.followup.send(f"Error generating dashboard: {str(e)}")
             return
 
-        view = DashboardView(project_name, project_url)
+        thread_name = context.thread_name
+        if result == 'updated':
+            await interaction.followup.send(f"Dashboard for {thread_name} updated.")
+        elif result == 'unchanged':
+            await interaction.followup.send(f"Dashboard for {thread_name} is already up to date.")
 
-        discord_helper = await self.get_discord()
-        self.category = await discord_helper.getCategory(int(self.project.group_id))
+        await interaction.followup.send(
+            f"Dashboard for {project_name} created in the 'project-dashboards' forum channel.")
 
-        # Check if a thread with the same name already exists
-        existing_thread = discord.utils.get(forum_channel.threads, name=self.category.name.upper())
+    def environment_status(self, aws_project, service_info):
+        """
+        Status de um ambiente AWS do projeto, a partir da resposta de AWSStatusCollector.services_info.
 
-        if existing_thread:
-            try:
-                initial_message = await existing_thread.fetch_message(existing_thread.id)
-                await initial_message.edit(content="", attachments=[dashboard_image], view=view)
-                await interaction.followup.send(f"Dashboard for {self.category.name.upper()} updated.")
-            except discord.NotFound:
-                await self.create_new_post(interaction, forum_channel, self.category.name.upper(), dashboard_image,
-                                           view)
-        else:
-            await self.create_new_post(interaction, forum_channel, self.category.name.upper(), dashboard_image, view)
+        Returns:
+            Tuple[EnvironmentStatus, Optional[datetime]]: Linha da dashboard e última atualização do service
+        """
+        environment_name = aws_project.environment.upper()
+        try:
+            # Verificar se tem cluster e service configurados
+            if not self.has_service(aws_project):
+                return EnvironmentStatus(
+                    environment_name=environment_name,
+                    service_status="⚠️",
+                    last_update="Cluster/Service não configurado"
+                ), None
+
+            if isinstance(service_info, asyncio.TimeoutError):
+                return EnvironmentStatus(
+                    environment_name=environment_name,
+                    service_status="⚠️",
+                    last_update=f"Sem resposta da AWS ({self.status_collector.config.timeout}s)"
+                ), None
+            if isinstance(service_info, BaseException):
+                raise service_info
+
+            if not service_info:
+                # Service não encontrado
+                return EnvironmentStatus(
+                    environment_name=environment_name,
+                    service_status="❌",
+                    last_update="Service não encontrado"
+                ), None
+
+            status_emoji_value = self.get_ecs_status_emoji(service_info['status'])
+            last_update = service_info['last_update']
+
+            # Formatar data de última atualização com timezone da região AWS
+            if last_update:
+                local_timezone = self.get_timezone_from_aws_region([aws_project])
+                last_update_local = last_update.astimezone(local_timezone)
+                formatted_date = format_date(last_update_local.strftime("%Y-%m-%d %H:%M:%SZ"))
+            else:
+                formatted_date = "Nunca executado"
+
+            # Séries acumuladas a cada coleta (sem chamadas extras à AWS)
+            key = series_key(aws_project)
+            return EnvironmentStatus(
+                environment_name=environment_name,
+                service_status=f"{status_emoji_value}",
+                last_update=formatted_date,
+                cpu=self.metric_store.series(key, CPU),
+                memory=self.metric_store.series(key, MEMORY),
+                running=self.metric_store.series(key, RUNNING)
+            ), last_update
 
-        await interaction.followup.send(
-            f"Dashboard for {project_name} created in the 'project-dashboards' forum channel.")
+        except Exception as e:
+            # Em caso de erro, mostrar ambiente com erro
+            return EnvironmentStatus(
+                environment_name=environment_name,
+                service_status="❌",
+                last_update=f"Erro: {str(e)[:30]}..."
+            ), None
+
+    @staticmethod
+    def has_service(aws_project) -> bool:
+        return bool(getattr(aws_project, 'cluster_name', None) and getattr(aws_project, 'service_name', None))
+
+    async def collect_category(self, projects):
+        """
+        Busca o status de todos os projetos da categoria numa única busca em lote:
+        os ambientes de todos os projetos vão juntos para o AWSStatusCollector, que
+        consulta cada cluster uma vez.
 
-    async def generate_dashboard_image(self):
-        project = self.project
-        apm = AWSProject()
+        Returns:
+            Tuple[List[ProjectStatus], Optional[datetime]]: Seções da dashboard e a atualização mais recente
+        """
+        # Buscar todos os ambientes AWS configurados para os projetos
+        aws_projects_by_project = await asyncio.gather(
+            *(AWSProject().get_aws_projects(project_id=project.id) for project in projects)
+        )
 
-        with open(projectItemPath, 'r') as f:
-            project_info_template = Template(f.read())
+        configured = [aws_project for aws_projects in aws_projects_by_project
+                      for aws_project in aws_projects if self.has_service(aws_project)]
+        answers = iter(await self.status_collector.services_info(configured) if configured else [])
+
+        sections = []
+        updates = []
+        for project, aws_projects in zip(projects, aws_projects_by_project):
+            if not aws_projects:
+                # Se não tem ambientes AWS configurados, mostrar mensagem
+                environments = [EnvironmentStatus(
+                    environment_name="Nenhum ambiente configurado",
+                    service_status="❌",
+                    last_update="N/A"
+                )]
+            else:
+                environments = []
+                for aws_project in aws_projects:
+                    # Mesma ordem de `configured`: as respostas são consumidas na sequência
+                    service_info = next(answers) if self.has_service(aws_project) else None
+                    environment, last_update = self.environment_status(aws_project, service_info)
+                    environments.append(environment)
+                    if last_update is not None:
+                        updates.append(last_update)
 
-        project_info_html = ''
-        project_last_run = None
+            sections.append(ProjectStatus(project_name=project.name, environments=tuple(environments)))
 
-        discord_helper = await self.get_discord()
-        self.category = await discord_helper.getCategory(int(project.group_id))
+        return sections, max(updates) if updates else None
 
-        # Buscar todos os ambientes AWS configurados para este projeto
-        aws_projects = await apm.get_aws_projects(project_id=project.id)
+    async def generate_dashboard_image(self, context: 'DashboardContext', collected=None):
+        """
+        Renderiza a dashboard composta da categoria descrita por `context` (todos os
+        projetos e ambientes numa única imagem). Nada é lido ou gravado em atributos
+        da cog, então várias dashboards podem ser geradas ao mesmo tempo.
+        """
+        # `collected` permite reaproveitar um status já buscado
+        sections, project_last_run = collected or await self.collect_category(context.projects)
 
-        if not aws_projects:
-            # Se não tem ambientes AWS configurados, mostrar mensagem
-            project_info_html = project_info_template.render(
-                environment_name="Nenhum ambiente configurado",
-                service_status="❌",
-                last_update="N/A"
-            )
+        # O updated_at da dashboard é a última atualização dos services (e não o momento
+        # da renderização), para que dados iguais gerem a mesma imagem e a edição seja pulada
+        if project_last_run is not None:
+            updated_at = format_date(project_last_run.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%SZ"))
         else:
-            # Para cada ambiente AWS, buscar status do service ECS específico
-            for aws_project in aws_projects:
-                try:
-                    # Verificar se tem cluster e service configurados
-                    if not hasattr(aws_project, 'cluster_name') or not hasattr(aws_project, 'service_name'):
-                        project_info_html += project_info_template.render(
-                            environment_name=aws_project.environment.upper(),
-                            service_status="⚠️",
-                            last_update="Cluster/Service não configurado"
-                        )
-                        continue
-
-                    if not aws_project.cluster_name or not aws_project.service_name:
-                        project_info_html += project_info_template.render(
-                            environment_name=aws_project.environment.upper(),
-                            service_status="⚠️",
-                            last_update="Cluster/Service não configurado"
-                        )
-                        continue
-
-                    aws_manager = AWSResourceManager(
-                        aws_project.aws_access_key,
-                        aws_project.aws_secret_key,
-                        aws_project.aws_region
-                    )
-
-                    # Buscar informações do service específico
-                    service_info = aws_manager.get_specific_service_info(
-                        aws_project.cluster_name,
-                        aws_project.service_name
-                    )
-
-                    if service_info:
-                        status_emoji_value = self.get_ecs_status_emoji(service_info['status'])
-                        last_update = service_info['last_update']
-
-                        # Formatar data de última atualização com timezone da região AWS
-                        if last_update:
-                            local_timezone = self.get_timezone_from_aws_region([aws_project])
-                            last_update_local = last_update.astimezone(local_timezone)
-                            formatted_date = format_date(last_update_local.strftime("%Y-%m-%d %H:%M:%SZ"))
-                            if project_last_run is None or last_update > project_last_run:
-                                project_last_run = last_update
-                        else:
-                            formatted_date = "Nunca executado"
-
-                        project_info_html += project_info_template.render(
-                            environment_name=aws_project.environment.upper(),
-                            service_status=f"{status_emoji_value}",
-                            last_update=formatted_date
-                        )
-                    else:
-                        # Service não encontrado
-                        project_info_html += project_info_template.render(
-                            environment_name=aws_project.environment.upper(),
-                            service_status="❌",
-                            last_update="Service não encontrado"
-                        )
-
-                except Exception as e:
-                    # Em caso de erro, mostrar ambiente com erro
-                    project_info_html += project_info_template.render(
-                        environment_name=aws_project.environment.upper(),
-                        service_status="❌",
-                        last_update=f"Erro: {str(e)[:30]}..."
-                    )
-
-        # Para o updated_at da dashboard, sempre usar o momento atual UTC
-        dashboard_generated_at = datetime.now(timezone.utc)
-
-        # Load and render the HTML templates
-        with open(overviewPath, 'r') as f:
-            overview_template = Template(f.read())
-
-        overview_html = overview_template.render(
+            updated_at = "N/A"
+
+        card = DashboardCard(
             project_icon="🚀",
-            project_name=self.category.name,
-            updated_at=format_date(dashboard_generated_at.strftime("%Y-%m-%d %H:%M:%SZ")),
-            repositories_box_content=project_info_html,
-            progress_bar_value=0,  # Removido barra de progresso
-            resource_use="N/A",  # Removido uso de recursos
-            instances_count=0  # Removido contagem de instâncias
+            project_name=context.category.name,
+            updated_at=updated_at,
+            projects=tuple(sections)
         )
 
-        # Use Playwright to render HTML and capture screenshot
-        async with async_playwright() as p:
-            browser = await p.chromium.launch()
-            page = await browser.new_page()
-            await page.set_content(overview_html)
-            await page.set_viewport_size({"width": 500, "height": 300})
-            screenshot = await page.screenshot()
-            await browser.close()
+        # Same card, same image: a cache hit skips rendering entirely, and since the
+        # bytes are identical edit_if_changed skips the upload as well
+        cache_key = render_key(f"{self.renderer.cache_key(card)}:{self.image_processor.signature}")
+        image = await self.render_cache.get(cache_key)
+        if image is None:
+            image = await self.renderer.render(card)
+            if not self.renderer.processes_images:
+                # Paleta + PNG otimizado/WebP: menos bytes a cada upload
+                image = await self.image_processor.process(image)
+            await self.render_cache.put(cache_key, image)
+
+        return discord.File(BytesIO(image), filename=f"dashboard.{self.image_processor.extension}")
+
+    async def dashboard_message(self, context: 'DashboardContext') -> Optional[discord.PartialMessage]:
+        """Mensagem inicial da dashboard da categoria, a partir do registro: sem nenhuma chamada à API."""
+        row = await Dashboard().get_dashboard(context.category.id)
+        if row is None:
+            return None
+
+        # Depois de um restart, o hash salvo evita reenviar uma imagem igual
+        if row.content_hash and last_hash(row.message_id) is None:
+            remember(row.message_id, row.content_hash)
+
+        return self.bot.get_partial_messageable(row.thread_id).get_partial_message(row.message_id)
+
+    async def find_dashboard_thread(self, forum_channel, thread_name: str):
+        """Busca pelo nome, incluindo threads arquivadas (que não ficam em `forum.threads`)."""
+        thread = discord.utils.get(forum_channel.threads, name=thread_name)
+        if thread is None:
+            async for archived_thread in forum_channel.archived_threads(limit=None):
+                if archived_thread.name == thread_name:
+                    return archived_thread
+        return thread
+
+    async def adopt_dashboards(self, forum_channel):
+        """
+        Registra, uma única vez, as dashboards publicadas antes do registro existir,
+        casando o nome das threads do fórum com o das categorias.
+        """
+        registry = Dashboard()
+        registered = {row.category_id for row in await registry.get_dashboards()}
+        categories = {category.name.upper(): category for category in forum_channel.guild.categories
+                      if category.id not in registered}
+        if not categories:
+            return
+
+        threads = list(forum_channel.threads)
+        async for archived_thread in forum_channel.archived_threads(limit=None):
+            threads.append(archived_thread)
+
+        for thread in threads:
+            category = categories.pop(thread.name, None)
+            if category is not None:
+                # A mensagem inicial de um post do fórum tem o mesmo id da thread
+                await registry.set_dashboard(category.id, forum_channel.id, thread.id, thread.id)
+                self.logger.info(f"Dashboard thread {thread.name} registered")
+
+    async def edit_dashboard(self, message: discord.PartialMessage, dashboard_image, view) -> bool:
+        try:
+            return await edit_if_changed(message, content="", attachments=[dashboard_image], view=view)
+        except discord.HTTPException as e:
+            if e.code != THREAD_ARCHIVED_ERROR:
+                raise
+            # Threads sem mensagens novas são arquivadas pelo Discord; desarquiva e tenta de novo
+            discord_helper = await self.get_discord()
+            await discord_helper.archiveForumThread(message.channel.id, archive=False, reason="Dashboard update")
+            dashboard_image.reset()
+            return await edit_if_changed(message, content="", attachments=[dashboard_image], view=view)
+
+    async def publish_dashboard(self, context: 'DashboardContext', dashboard_image, view, create: bool = False) -> str:
+        """
+        Atualiza a dashboard registrada da categoria, ou cria o post quando `create`
+        (ou quando a dashboard registrada foi apagada).
 
-        return discord.File(BytesIO(screenshot), filename="dashboard.png")
+        Returns:
+            str: 'updated', 'unchanged', 'created' ou 'missing'
+        """
+        registry = Dashboard()
+        message = await self.dashboard_message(context)
 
-    async def create_new_post(self, interaction, forum_channel, project_name, dashboard_image, view):
-        thread, message = await forum_channel.create_thread(
-            name=project_name,
+        if message is not None:
+            try:
+                if await self.edit_dashboard(message, dashboard_image, view):
+                    await registry.set_content_hash(context.category.id, last_hash(message.id))
+                    return 'updated'
+                return 'unchanged'
+            except discord.NotFound:
+                # O post foi apagado: recria
+                forget(message.id)
+                await registry.remove_dashboard(context.category.id)
+                dashboard_image.reset()
+                create = True
+
+        if not create or context.forum_channel is None:
+            return 'missing'
+
+        # Dashboard publicada antes do registro (possivelmente arquivada): registra em vez de duplicar
+        if message is None:
+            thread = await self.find_dashboard_thread(context.forum_channel, context.thread_name)
+            if thread is not None:
+                await registry.set_dashboard(context.category.id, context.forum_channel.id, thread.id, thread.id)
+                return await self.publish_dashboard(context, dashboard_image, view)
+
+        digest = content_hash(content="", attachments=[dashboard_image], view=view)
+        thread, message = await context.forum_channel.create_thread(
+            name=context.thread_name,
             content="",
             file=dashboard_image,
-            view=view
+            view=view,
+            auto_archive_duration=10080
         )
-        self.dashboard_posts[project_name] = thread.id
+        remember(message.id, digest)
+        await registry.set_dashboard(context.category.id, context.forum_channel.id, thread.id, message.id, digest)
+        return 'created'
+
+    async def dashboard_jobs(self):
+        """
+        Um job por thread de dashboard: a imagem é da categoria, com todos os seus
+        projetos renderizados juntos (uma busca de status e uma renderização por categoria).
+        """
+        self.logger.info(f"Render cache: {self.render_cache.stats()}")
+        self.logger.info(f"Dashboard images: {self.image_processor.stats()}")
+        self.logger.info(f"Dashboard renderer ({self.renderer.name}): {self.renderer.stats()}")
 
-    async def update_dashboards_periodically(self):
-        print("Update Dashboard Task Started")
-        await self.bot.wait_until_ready()
-        while not self.bot.is_closed():
-            print("Update Dashboard Task: Updating dashboards...")
+        guild = self.bot.guilds[0]
+        # O fórum é buscado uma vez por ciclo
+        forum_channel = discord.utils.get(guild.forums, name=DASHBOARD_CHANNEL_NAME)
+        if not forum_channel:
+            return []
+
+        if not self.dashboards_adopted:
+            await self.adopt_dashboards(forum_channel)
+            self.dashboards_adopted = True
+
+        # Só categorias com dashboard registrada
+        registered = {row.category_id for row in await Dashboard().get_dashboards()}
+
+        jobs = []
+        for category in guild.categories:
+            if category.id not in registered:
+                continue
+            job = await self.category_job(forum_channel, category)
+            if job:
+                jobs.append(job)
+        return jobs
+
+    async def category_job(self, forum_channel, category):
+        projects = await Project().get_projects_by_group_id(category.id)
+        return DashboardContext(category=category, projects=tuple(projects), forum_channel=forum_channel) if projects else None
+
+    async def on_project_state_changed(self, event: ProjectStateChanged):
+        """Pipeline/deploy/merge de um projeto: atualiza só a dashboard da categoria dele."""
+        guild = self.bot.guilds[0] if self.bot.guilds else None
+        forum_channel = discord.utils.get(guild.forums, name=DASHBOARD_CHANNEL_NAME) if guild else None
+        if not forum_channel:
+            return
 
-            try:
-                discord_helper = await self.get_discord()
-                guild = self.bot.guilds[0]
-
-                for category in guild.categories:
-                    projects = await Project().get_projects_by_group_id(category.id)
-                    for project in projects:
-                        forum_channel = discord.utils.get(guild.forums, name=DASHBOARD_CHANNEL_NAME)
-                        if forum_channel:
-                            try:
-                                await self.getProject(project.id)
-                                project_name = self.project.name
-
-                                view = DashboardView(project_name, getattr(self.project, 'repository_url', '#'))
-                                dashboard_image = await self.generate_dashboard_image()
-
-                                # Check if a thread with the same name already exists
-                                existing_thread = discord.utils.get(forum_channel.threads,
-                                                                    name=self.category.name.upper())
-
-                                if existing_thread:
-                                    try:
-                                        initial_message = await existing_thread.fetch_message(existing_thread.id)
-                                        await initial_message.edit(content="", attachments=[dashboard_image], view=view)
-                                    except discord.NotFound:
-                                        thread, message = await forum_channel.create_thread(
-                                            name=self.category.name.upper(),
-                                            content="",
-                                            file=dashboard_image,
-                                            view=view
-                                        )
-                                        self.dashboard_posts[project_name] = thread.id
-
-                            except discord.NotFound:
-                                print(f"Dashboard thread for {project_name} not found. Removing from tracking.")
-                                if project_name in self.dashboard_posts:
-                                    del self.dashboard_posts[project_name]
-                            except Exception as e:
-                                print(f"Error updating dashboard for {project_name}: {str(e)}")
-
-                print("Update Dashboard Task: Dashboards updated.")
-
-            except Exception as e:
-                print(f"Error in update_dashboards_periodically: {str(e)}")
-
-            await asyncio.sleep(60 * 5)  # Update every 5 minutes
+        discord_helper = await self.get_discord()
+        category = await discord_helper.getCategory(event.group_id)
+        if not category or await Dashboard().get_dashboard(category.id) is None:
+            return
+
+        job = await self.category_job(forum_channel, category)
+        if job:
+            self.logger.info(f"Dashboard {category.name} refresh requested ({event.reason})")
+            self.scheduler.trigger(job)
+
+    async def refresh_dashboard(self, job: 'DashboardContext'):
+        # Só atualiza dashboards já criadas (via /create_dashboard)
+        await self.update_dashboard(job)
+
+    async def update_dashboard(self, context: 'DashboardContext', create: bool = False) -> str:
+        """
+        Gera e publica a dashboard da categoria, single-flight por thread: chamadas
+        simultâneas (vários /create_dashboard, ou um deles durante a atualização
+        periódica) esperam a que está em andamento e recebem o mesmo resultado, com
+        uma só busca na AWS, renderização e envio.
+
+        Returns:
+            str: O resultado de publish_dashboard
+        """
+        key = ('dashboard', context.category.id)
+        if self.dashboard_flight.in_flight(key):
+            self.logger.info(f"Dashboard {context.thread_name} already being updated; waiting for it")
+
+        result = await self.dashboard_flight.do(key, lambda: self._update_dashboard(context, create))
+        if result == 'missing' and create:
+            # Pegou carona numa atualização periódica, que não cria posts
+            result = await self.dashboard_flight.do(key, lambda: self._update_dashboard(context, create))
+        return result
+
+    async def _update_dashboard(self, context: 'DashboardContext', create: bool) -> str:
+        # Os botões são do projeto do contexto, o mesmo em toda atualização (senão a mensagem mudaria à toa)
+        project = context.project
+        view = DashboardView(project.name, getattr(project, 'repository_url', '#'))
+        dashboard_image = await self.generate_dashboard_image(context)
+        return await self.publish_dashboard(context, dashboard_image, view, create=create)
+
+
+@dataclass(frozen=True)
+class DashboardContext:
+    """Tudo o que uma renderização/atualização precisa; também é o job do scheduler."""
+    category: discord.CategoryChannel
+    projects: Tuple[object, ...]
+    forum_channel: Optional[discord.ForumChannel] = None
+
+    @property
+    def project(self):
+        # Projeto dos botões da dashboard (o último da categoria, como antes da dashboard composta)
+        return self.projects[-1]
+
+    @property
+    def thread_name(self) -> str:
+        return self.category.name.upper()
 
 
 async def setup(bot):
@@ -6,22 +6,23 @@ class AWSResourceManager:
 
     status = "idle"
 
-    def __init__(self, aws_access_key=None, aws_secret_key=None, aws_region=None):
+    def __init__(self, aws_access_key=None, aws_secret_key=None, aws_region=None, client_config=None):
         self.status = "initialized"
         if aws_access_key != None and aws_secret_key != None and aws_region != None:
-            self.setup(aws_access_key, aws_secret_key, aws_region)
+            self.setup(aws_access_key, aws_secret_key, aws_region, client_config)
 
 
-    def setup(self, aws_access_key, aws_secret_key, aws_region):
+    def setup(self, aws_access_key, aws_secret_key, aws_region, client_config=None):
         try:        
             self.session = boto3.Session(
                 aws_access_key_id=aws_access_key,
                 aws_secret_access_key=aws_secret_key,
                 region_name=aws_region
             )
-            self.ecs_client = self.session.client('ecs')
-            self.rds_client = self.session.client('rds')
-            self.cloudwatch_client = self.session.client('cloudwatch')
+            # client_config (botocore Config) permite limitar timeouts/retries das chamadas
+            self.ecs_client = self.session.client('ecs', config=client_config)
+            self.rds_client = self.session.client('rds', config=client_config)
+            self.cloudwatch_client = self.session.client('cloudwatch', config=client_config)
             self.status = "configured"
         except Exception as e:
             self.status = "error"
@@ -79,85 +80,132 @@ class AWSResourceManager:
         Returns:
             dict: Informações do service ou None se não encontrado
         """
-        if self.status != "configured":
-            raise Exception("AWS resource manager not configured")
+        return self.get_services_info(cluster_name, [service_name])[service_name]
 
-        try:
-            # Busca detalhes do service específico
-            services_response = self.ecs_client.describe_services(
-                cluster=cluster_name,
-                services=[service_name]
-            )
+    def get_services_info(self, cluster_name, service_names):
+        """
+        Versão em lote de get_specific_service_info: um describe_services a cada 10
+        services (limite da API) e as métricas de todos em get_metric_data.
 
-            if not services_response['services']:
-                return None  # Service não encontrado
-
-            service = services_response['services'][0]
-
-            # Informações básicas do service
-            running_count = service['runningCount']
-            desired_count = service['desiredCount']
-            pending_count = service['pendingCount']
-
-            # Pega data de última atualização do taskSet ou deployment
-            last_update = None
-            if service.get('deployments') and len(service['deployments']) > 0:
-                last_update = service['deployments'][0].get('updatedAt')
-            elif service.get('taskSets') and len(service['taskSets']) > 0:
-                last_update = service['taskSets'][0].get('updatedAt')
-
-            # Se não achou, usa o campo updatedAt do próprio service
-            if not last_update:
-                last_update = service.get('updatedAt')
-
-            # Determina status baseado nas contagens
-            if pending_count > 0:
-                status = "running"  # Em deployment
-            elif running_count > 0:
-                status = "success"  # Rodando normalmente
-            else:
-                status = "failed"  # Parado
-
-            # Busca métricas do CloudWatch para o service específico
-            cpu_metric = self.get_cloudwatch_metric(
-                'AWS/ECS',
-                'CPUUtilization',
-                [
-                    {'Name': 'ClusterName', 'Value': cluster_name},
-                    {'Name': 'ServiceName', 'Value': service_name}
-                ]
-            )
+        Args:
+            cluster_name (str): Nome do cluster ECS
+            service_names (list): Nomes dos services ECS do cluster
 
-            memory_metric = self.get_cloudwatch_metric(
-                'AWS/ECS',
-                'MemoryUtilization',
-                [
-                    {'Name': 'ClusterName', 'Value': cluster_name},
-                    {'Name': 'ServiceName', 'Value': service_name}
-                ]
-            )
+        Returns:
+            dict: Nome do service -> informações (None se não encontrado)
+        """
+        if self.status != "configured":
+            raise Exception("AWS resource manager not configured")
 
-            return {
-                'cluster': cluster_name,
-                'service': service_name,
-                'running_count': running_count,
-                'desired_count': desired_count,
-                'pending_count': pending_count,
-                'status': status,
-                'last_update': last_update,
-                'cpu_usage': round(cpu_metric, 2) if cpu_metric else 0,
-                'memory_usage': round(memory_metric, 2) if memory_metric else 0,
-                'service_arn': service['serviceArn'],
-                'task_definition': service['taskDefinition']
-            }
+        service_names = list(dict.fromkeys(service_names))
+        try:
+            services = {}
+            for start in range(0, len(service_names), 10):
+                services_response = self.ecs_client.describe_services(
+                    cluster=cluster_name,
+                    services=service_names[start:start + 10]
+                )
+                # Services inexistentes vêm em 'failures', não em 'services'
+                for service in services_response['services']:
+                    # O service pode ter sido configurado pelo nome ou pelo ARN
+                    requested = service['serviceArn'] if service['serviceArn'] in service_names else service['serviceName']
+                    services[requested] = service
+
+            metrics = self.get_services_metrics(cluster_name, list({service['serviceName'] for service in services.values()}))
 
         except self.ecs_client.exceptions.ClusterNotFoundException:
             raise Exception(f"Cluster '{cluster_name}' not found")
-        except self.ecs_client.exceptions.ServiceNotFoundException:
-            raise Exception(f"Service '{service_name}' not found in cluster '{cluster_name}'")
         except Exception as e:
             raise Exception(f"Error getting service info: {str(e)}")
 
+        return {
+            service_name: self.service_summary(cluster_name, services[service_name],
+                                               *metrics[services[service_name]['serviceName']])
+            if service_name in services else None
+            for service_name in service_names
+        }
+
+    def service_summary(self, cluster_name, service, cpu_metric, memory_metric):
+        """Resumo de um service retornado por describe_services (formato de get_specific_service_info)."""
+        # Informações básicas do service
+        running_count = service['runningCount']
+        desired_count = service['desiredCount']
+        pending_count = service['pendingCount']
+
+        # Pega data de última atualização do taskSet ou deployment
+        last_update = None
+        if service.get('deployments') and len(service['deployments']) > 0:
+            last_update = service['deployments'][0].get('updatedAt')
+        elif service.get('taskSets') and len(service['taskSets']) > 0:
+            last_update = service['taskSets'][0].get('updatedAt')
+
+        # Se não achou, usa o campo updatedAt do próprio service
+        if not last_update:
+            last_update = service.get('updatedAt')
+
+        # Determina status baseado nas contagens
+        if pending_count > 0:
+            status = "running"  # Em deployment
+        elif running_count > 0:
+            status = "success"  # Rodando normalmente
+        else:
+            status = "failed"  # Parado
+
+        return {
+            'cluster': cluster_name,
+            'service': service['serviceName'],
+            'running_count': running_count,
+            'desired_count': desired_count,
+            'pending_count': pending_count,
+            'status': status,
+            'last_update': last_update,
+            # None quando o CloudWatch não tem datapoints (não é uso zero)
+            'cpu_usage': round(cpu_metric, 2) if cpu_metric is not None else None,
+            'memory_usage': round(memory_metric, 2) if memory_metric is not None else None,
+            'service_arn': service['serviceArn'],
+            'task_definition': service['taskDefinition']
+        }
+
+    def get_services_metrics(self, cluster_name, service_names):
+        """
+        CPU e memória (média dos últimos 5 minutos, como get_cloudwatch_metric) de
+        vários services do cluster, com até 500 consultas por chamada get_metric_data.
+
+        Returns:
+            dict: Nome do service -> (cpu, memória); None onde não há datapoints no período
+        """
+        queries = []
+        for index, service_name in enumerate(service_names):
+            dimensions = [
+                {'Name': 'ClusterName', 'Value': cluster_name},
+                {'Name': 'ServiceName', 'Value': service_name}
+            ]
+            for prefix, metric_name in (('cpu', 'CPUUtilization'), ('mem', 'MemoryUtilization')):
+                queries.append({
+                    'Id': f'{prefix}{index}',
+                    'MetricStat': {
+                        'Metric': {'Namespace': 'AWS/ECS', 'MetricName': metric_name, 'Dimensions': dimensions},
+                        'Period': 300,
+                        'Stat': 'Average'
+                    }
+                })
+
+        values = {}
+        end_time = datetime.utcnow()
+        for start in range(0, len(queries), 500):
+            response = self.cloudwatch_client.get_metric_data(
+                MetricDataQueries=queries[start:start + 500],
+                StartTime=end_time - timedelta(minutes=5),
+                EndTime=end_time
+            )
+            for result in response['MetricDataResults']:
+                values[result['Id']] = result['Values'][0] if result['Values'] else None
+
+        return {
+            service_name: (values.get(f'cpu{index}'), values.get(f'mem{index}'))
+            for index, service_name in enumerate(service_names)
+        }
+
     def get_rds_info(self):
         if self.status != "configured":
             raise Exception("AWS resource manager not configured")
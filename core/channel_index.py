@@ -0,0 +1,149 @@
+import discord
+from discord.channel import ForumChannel
+from core.logger import getLogger
+from typing import Dict, Optional, Tuple
+
+logger = getLogger('channel_index')
+
+# Sentinel para "qualquer categoria" nas buscas por nome
+ANY_CATEGORY = object()
+
+CHANNEL_KINDS = ('text', 'voice', 'forum', 'stage', 'category', 'other')
+
+
+def channelKind(channel) -> str:
+    """
+    Maps a guild channel to the kind used as part of the index key.
+    """
+    if isinstance(channel, discord.CategoryChannel):
+        return 'category'
+    if isinstance(channel, ForumChannel):
+        return 'forum'
+    if isinstance(channel, discord.StageChannel):
+        return 'stage'
+    if isinstance(channel, discord.VoiceChannel):
+        return 'voice'
+    if isinstance(channel, discord.TextChannel):
+        return 'text'
+    return 'other'
+
+
+class ChannelIndex:
+    """
+    Per-guild channel index keyed by id and by (kind, category_id, name).
+
+    The index is built once from ``guild.channels`` and kept up to date by the
+    ``on_guild_channel_create/update/delete`` events (see ``main.py``) and by the
+    helpers in ``core.discord`` right after they create a channel, so lookups
+    never scan the guild channel lists.
+    """
+
+    def __init__(self, guild: discord.Guild):
+        self.guild_id = guild.id
+        self._by_id: Dict[int, discord.abc.GuildChannel] = {}
+        self._by_key: Dict[Tuple[str, Optional[int], str], Dict[int, discord.abc.GuildChannel]] = {}
+        self._by_name: Dict[Tuple[str, str], Dict[int, discord.abc.GuildChannel]] = {}
+        self._keys: Dict[int, Tuple[str, Optional[int], str]] = {}
+        self.build(guild)
+
+    def build(self, guild: discord.Guild):
+        self._by_id.clear()
+        self._by_key.clear()
+        self._by_name.clear()
+        self._keys.clear()
+        for channel in guild.channels:
+            self.add(channel)
+        logger.info(f"Channel index built for guild {guild.id}: {len(self._by_id)} channels")
+
+    def add(self, channel):
+        if channel.id in self._keys:
+            self.remove(channel.id)
+
+        kind = channelKind(channel)
+        category_id = None if kind == 'category' else channel.category_id
+        key = (kind, category_id, channel.name)
+
+        self._by_id[channel.id] = channel
+        self._keys[channel.id] = key
+        self._by_key.setdefault(key, {})[channel.id] = channel
+        self._by_name.setdefault((kind, channel.name), {})[channel.id] = channel
+
+    def remove(self, channel_id: int):
+        key = self._keys.pop(channel_id, None)
+        self._by_id.pop(channel_id, None)
+        if key is None:
+            return
+
+        kind, _, name = key
+        for index, index_key in ((self._by_key, key), (self._by_name, (kind, name))):
+            bucket = index.get(index_key)
+            if bucket is not None:
+                bucket.pop(channel_id, None)
+                if not bucket:
+                    del index[index_key]
+
+    def update(self, channel):
+        # Re-indexa o canal, já que nome ou categoria podem ter mudado
+        self.add(channel)
+
+    def getById(self, channel_id: int):
+        return self._by_id.get(channel_id)
+
+    def get(self, kind: str, name: str, category_id=ANY_CATEGORY):
+        """
+        Returns the channel of ``kind`` named ``name``.
+
+        Parameters:
+            kind (str): One of ``CHANNEL_KINDS``.
+            name (str): The channel name.
+            category_id (Optional[int]): Restricts the lookup to a category; ``None`` means
+                channels without a category. Omit it to search the whole guild.
+
+        Returns:
+            The oldest matching channel (lowest id), mirroring Discord's ordering for duplicates.
+        """
+        if category_id is ANY_CATEGORY:
+            bucket = self._by_name.get((kind, name))
+        else:
+            bucket = self._by_key.get((kind, category_id, name))
+
+        if not bucket:
+            return None
+        return bucket[min(bucket)]
+
+    def __len__(self):
+        return len(self._by_id)
+
+
+_indexes: Dict[int, ChannelIndex] = {}
+
+
+def getChannelIndex(guild: discord.Guild) -> ChannelIndex:
+    """Returns the channel index for ``guild``, building it on first use."""
+    index = _indexes.get(guild.id)
+    if index is None:
+        index = ChannelIndex(guild)
+        _indexes[guild.id] = index
+    return index
+
+
+def onChannelCreate(channel):
+    index = _indexes.get(channel.guild.id)
+    if index is not None:
+        index.add(channel)
+
+
+def onChannelUpdate(before, after):
+    index = _indexes.get(after.guild.id)
+    if index is not None:
+        index.update(after)
+
+
+def onChannelDelete(channel):
+    index = _indexes.get(channel.guild.id)
+    if index is not None:
+        index.remove(channel.id)
+
+
+def dropChannelIndex(guild_id: int):
+    _indexes.pop(guild_id, None)
@@ -1,3 +1,4 @@
+import discord
 from Config import Config
 from core.logger import getLogger
 from discord.ext import commands
@@ -17,8 +18,15 @@ class Cog(commands.Cog):
         instance = cls(bot)
         print(f"Instância criada: {instance}")
 
+        # Guardada para que o bot chame cog_unload ao encerrar
+        if hasattr(bot, 'registered_cogs'):
+            bot.registered_cogs.append(instance)
+
         # Adiciona todos os comandos app_commands da classe à árvore
         for command in instance.__cog_app_commands__:
             bot.tree.add_command(command)
 
-        print(f"Registrados {len(instance.__cog_app_commands__)} comandos no app_commands")
\ No newline at end of file
+        print(f"Registrados {len(instance.__cog_app_commands__)} comandos no app_commands")
+
+        # Cogs registradas assim não passam por bot.add_cog; o hook é chamado aqui
+        await discord.utils.maybe_coroutine(instance.cog_load)
\ No newline at end of file
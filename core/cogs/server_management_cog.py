@@ -3,6 +3,7 @@ import asyncio
 from discord import app_commands
 from discord.ext import commands
 from core.cog import Cog
+from core.teardown import BulkTeardown
 
 class ServerManagementCog(Cog):
     def __init__(self, bot):
@@ -25,14 +26,11 @@ class ServerManagementCog(Cog):
             await confirmation.edit(content="Command cancelled: You didn't confirm in time.")
             return
         else:
-            # Delete all channels
-            for channel in ctx.guild.channels:
-                try:
-                    await channel.delete()
-                except discord.Forbidden:
-                    await ctx.author.send(f"Failed to delete channel {channel.name}. Missing permissions.")
-                except discord.HTTPException:
-                    await ctx.author.send(f"Failed to delete channel {channel.name}. HTTP exception occurred.")
+            # Delete all channels concurrently, reporting failures in a single summary
+            teardown = BulkTeardown(reason=f"Server reset requested by {ctx.author}")
+            report = await teardown.run(ctx.guild.channels, delete_threads=False)
+            if not report.ok:
+                await ctx.author.send(f"Some channels could not be deleted.\n{report.summary()}")
 
             # Create a new channel to inform about the deletion
             try:
@@ -0,0 +1,60 @@
+from core.db.DB import DB, DotDict
+import aiosqlite
+from typing import List, Optional
+
+
+def dashboardFromCursor(row):
+    return DotDict({
+        'category_id': int(row[0]),
+        'forum_id': int(row[1]),
+        'thread_id': int(row[2]),
+        'message_id': int(row[3]),
+        'content_hash': row[4],
+    })
+
+
+class Dashboard(DB):
+    """Registro das dashboards publicadas: uma thread do fórum por categoria."""
+
+    async def initialize(self):
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute('''
+                CREATE TABLE IF NOT EXISTS dashboards
+                (
+                             category_id TEXT PRIMARY KEY,
+                             forum_id TEXT,
+                             thread_id TEXT,
+                             message_id TEXT,
+                             content_hash TEXT
+                )
+            ''')
+            await db.commit()
+
+    ### DASHBOARD DATA FUNCTIONS
+    async def get_dashboard(self, category_id) -> Optional[DotDict]:
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute('SELECT category_id, forum_id, thread_id, message_id, content_hash FROM dashboards WHERE category_id = ?', (str(category_id),)) as cursor:
+                row = await cursor.fetchone()
+                return dashboardFromCursor(row) if row else None
+
+    async def get_dashboards(self) -> List[DotDict]:
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute('SELECT category_id, forum_id, thread_id, message_id, content_hash FROM dashboards') as cursor:
+                rows = await cursor.fetchall()
+                return [dashboardFromCursor(row) for row in rows if row]
+
+    async def set_dashboard(self, category_id, forum_id, thread_id, message_id, content_hash=None):
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute('INSERT OR REPLACE INTO dashboards (category_id, forum_id, thread_id, message_id, content_hash) VALUES (?, ?, ?, ?, ?)',
+                             (str(category_id), str(forum_id), str(thread_id), str(message_id), content_hash))
+            await db.commit()
+
+    async def set_content_hash(self, category_id, content_hash):
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute('UPDATE dashboards SET content_hash = ? WHERE category_id = ?', (content_hash, str(category_id)))
+            await db.commit()
+
+    async def remove_dashboard(self, category_id):
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute('DELETE FROM dashboards WHERE category_id = ?', (str(category_id),))
+            await db.commit()
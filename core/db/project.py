@@ -1,5 +1,6 @@
 from core.db.DB import DB, DotDict
 import aiosqlite
+from typing import Optional
 
 
 def projectFields() -> list[str]:
@@ -40,10 +41,21 @@ class Project(DB):
                              name TEXT,
                              channel_name TEXT,
                              group_name TEXT,
-                             project_url TEXT
+                             project_url TEXT,
+                             thread_forum_id TEXT,
+                             thread_archived INTEGER
                 )
             ''')
 
+            # Bancos criados antes da cache de localização das threads
+            async with db.execute('PRAGMA table_info(projects)') as cursor:
+                columns = [row[1] for row in await cursor.fetchall()]
+            if 'thread_forum_id' not in columns:
+                await db.execute('ALTER TABLE projects ADD COLUMN thread_forum_id TEXT')
+            if 'thread_archived' not in columns:
+                await db.execute('ALTER TABLE projects ADD COLUMN thread_archived INTEGER')
+            await db.commit()
+
     ### PROJECT DATA FUNCTIONS
     async def get_projects(self):
         async with aiosqlite.connect(self.db_path) as db:
@@ -85,9 +97,22 @@ class Project(DB):
 
     async def unset_thread(self, project_id, thread_id):
         async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('UPDATE projects SET thread_id = null WHERE id = ? and thread_id = ?', (project_id, thread_id))
+            await db.execute('UPDATE projects SET thread_id = null, thread_forum_id = null, thread_archived = null WHERE id = ? and thread_id = ?', (project_id, thread_id))
+            await db.commit()
+
+    async def set_thread_location(self, thread_id, forum_id, archived: Optional[bool]):
+        # forum_id/archived None apagam a localização guardada
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute('UPDATE projects SET thread_forum_id = ?, thread_archived = ? WHERE thread_id = ?',
+                             (forum_id, None if archived is None else int(archived), thread_id))
             await db.commit()
 
+    async def get_thread_location(self, thread_id):
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute('SELECT thread_forum_id, thread_archived FROM projects WHERE thread_id = ? AND thread_forum_id IS NOT NULL', (thread_id,)) as cursor:
+                row = await cursor.fetchone()
+                return (int(row[0]), bool(row[1])) if row else None
+
     async def get_project_by_thread(self, thread_id):
         async with aiosqlite.connect(self.db_path) as db:
             async with db.execute(f'SELECT {", ".join(projectFields())} FROM projects WHERE thread_id = ?', (thread_id,)) as cursor:
@@ -1,7 +1,19 @@
 import discord
 from discord.channel import ForumChannel, Thread
+from core.channel_index import getChannelIndex, ChannelIndex
+from core.db.project import Project
 from core.logger import getLogger
-from typing import Union, Optional, Tuple
+from core.teardown import BulkTeardown, ProgressCallback
+from helpers.single_flight import SingleFlight
+from typing import Awaitable, Callable, Dict, Union, Optional, Tuple
+
+# Criações em andamento por (guild_id, kind, category_id, name), compartilhadas com o DiscordManager
+creation_flight = SingleFlight()
+
+# thread_id -> (forum_id, archived); espelhada em projects.thread_forum_id/thread_archived
+_thread_locations: Dict[int, Tuple[int, bool]] = {}
+# Threads arquivadas lidas de uma vez (uma página da API) antes de cair no fetch_channel
+ARCHIVED_LOOKUP_LIMIT = 100
 
 
 class Discord:
@@ -9,6 +21,49 @@ class Discord:
         self.logger = getLogger()
         self.guild = guild
 
+    @property
+    def index(self) -> ChannelIndex:
+        return getChannelIndex(self.guild)
+
+    async def getOrCreateChannel(
+        self,
+        kind: str,
+        name: str,
+        category_id: Optional[int],
+        create: Callable[[], Awaitable]
+    ) -> Tuple[object, bool]:
+        """
+        Looks a channel up in the index and creates it if missing, single-flight per
+        (guild, kind, category, name): concurrent callers share one creation.
+
+        Parameters:
+            kind (str): Channel kind as used by the channel index ('category', 'text', ...).
+            name (str): The channel name.
+            category_id (Optional[int]): Parent category id, None for the guild root.
+            create (Callable[[], Awaitable]): Creates the channel when it does not exist.
+
+        Returns:
+            Tuple[object, bool]: (channel, created)
+        """
+        def lookup():
+            return self.index.get(kind, name, category_id=category_id)
+
+        channel = lookup()
+        if channel:
+            return channel, False
+
+        async def flight():
+            # Someone may have finished creating it while we waited for our turn
+            existing = lookup()
+            if existing:
+                return existing, False
+            created = await create()
+            self.index.add(created)
+            return created, True
+
+        key = (self.guild.id, kind, category_id, name)
+        return await creation_flight.do(key, flight)
+
     async def addCategory(self, category_name: str) -> discord.CategoryChannel:
         """
         Adds a new category to the Discord server.
@@ -19,9 +74,10 @@ class Discord:
         Returns:
             discord.CategoryChannel: The created or existing category.
         """
-        category = discord.utils.get(self.guild.categories, name=category_name)
-        if not category:
-            category = await self.guild.create_category(category_name)
+        category, created = await self.getOrCreateChannel(
+            'category', category_name, None, lambda: self.guild.create_category(category_name)
+        )
+        if created:
             self.logger.info(f"Created new category: {category_name}")
         else:
             self.logger.info(f"Using existing category: {category_name}")
@@ -45,9 +101,11 @@ class Discord:
         if category is None:
             category = self.guild
 
-        text_channel = discord.utils.get(self.guild.text_channels, name=channel_name)
-        if not text_channel:
-            text_channel = await category.create_text_channel(channel_name)
+        category_id = category.id if isinstance(category, discord.CategoryChannel) else None
+        text_channel, created = await self.getOrCreateChannel(
+            'text', channel_name, category_id, lambda: category.create_text_channel(channel_name)
+        )
+        if created:
             self.logger.info(f"Created new text channel: {channel_name}")
         else:
             self.logger.info(f"Text channel '{channel_name}' already exists")
@@ -73,13 +131,16 @@ class Discord:
         if category is None:
             category = self.guild
 
-        forum_channel = discord.utils.get(self.guild.forums, name=channel_name)
-        if not forum_channel:
-            forum_channel = await category.create_forum(
+        category_id = category.id if isinstance(category, discord.CategoryChannel) else None
+        forum_channel, created = await self.getOrCreateChannel(
+            'forum', channel_name, category_id,
+            lambda: category.create_forum(
                 name=channel_name,
                 topic=topic,
                 reason=f"Created forum channel: {channel_name}"
             )
+        )
+        if created:
             self.logger.info(f"Created new forum channel: {channel_name}")
         else:
             self.logger.info(f"Forum channel '{channel_name}' already exists")
@@ -107,9 +168,11 @@ class Discord:
         if category is None:
             category = self.guild
 
-        voice_channel = discord.utils.get(self.guild.voice_channels, name=channel_name)
-        if not voice_channel:
-            voice_channel = await category.create_voice_channel(channel_name)
+        category_id = category.id if isinstance(category, discord.CategoryChannel) else None
+        voice_channel, created = await self.getOrCreateChannel(
+            'voice', channel_name, category_id, lambda: category.create_voice_channel(channel_name)
+        )
+        if created:
             self.logger.info(f"Created new voice channel: {channel_name}")
         else:
             self.logger.info(f"Voice channel '{channel_name}' already exists")
@@ -133,26 +196,25 @@ class Discord:
         """
         if isinstance(channel_identifier, int):
             # Search by ID
-            channel = self.guild.get_channel(channel_identifier)
+            channel = self.index.getById(channel_identifier)
             if channel and category:
                 return channel if channel.category_id == category.id else None
             return channel
         else:
             # Search by name
             if category:
-                return discord.utils.get(category.channels, name=channel_identifier)
+                for kind in ('text', 'voice', 'forum', 'stage'):
+                    channel = self.index.get(kind, channel_identifier, category_id=category.id)
+                    if channel:
+                        return channel
+                return None
             
             # Search in all channel types
-            channel = discord.utils.get(self.guild.text_channels, name=channel_identifier)
-            if channel:
-                return channel
-            
-            channel = discord.utils.get(self.guild.voice_channels, name=channel_identifier)
-            if channel:
-                return channel
-            
-            channel = discord.utils.get(self.guild.forums, name=channel_identifier)
-            return channel
+            for kind in ('text', 'voice', 'forum'):
+                channel = self.index.get(kind, channel_identifier)
+                if channel:
+                    return channel
+            return None
 
     async def getCategory(self, category_identifier: Union[str, int]) -> Optional[discord.CategoryChannel]:
         """
@@ -165,14 +227,15 @@ class Discord:
             Optional[discord.CategoryChannel]: The retrieved category if found.
         """
         if isinstance(category_identifier, int):
-            return self.guild.get_channel(category_identifier)
-        return discord.utils.get(self.guild.categories, name=category_identifier)
+            return self.index.getById(category_identifier)
+        return self.index.get('category', category_identifier)
 
     async def removeChannel(
         self, 
         channel_identifier: Union[str, int], 
         reason: str = None,
-        delete_threads: bool = True
+        delete_threads: bool = True,
+        on_progress: Optional[ProgressCallback] = None
     ) -> bool:
         """
         Removes a channel from the Discord server.
@@ -181,6 +244,7 @@ class Discord:
             channel_identifier (Union[str, int]): The name or ID of the channel to be removed.
             reason (str, optional): The reason for removing the channel.
             delete_threads (bool): Whether to delete forum threads when removing a forum channel.
+            on_progress (ProgressCallback, optional): Called with (done, total) while deleting.
 
         Returns:
             bool: True if the channel was removed successfully, False otherwise.
@@ -188,17 +252,12 @@ class Discord:
         try:
             channel = await self.getChannel(channel_identifier)
             if channel:
-                # Handle forum channels specially
-                if isinstance(channel, ForumChannel) and delete_threads:
-                    # Delete all threads in the forum
-                    async for thread in channel.archived_threads():
-                        await thread.delete(reason=reason)
-                    
-                    # Delete active threads
-                    for thread in channel.threads:
-                        await thread.delete(reason=reason)
-
-                await channel.delete(reason=reason)
+                teardown = BulkTeardown(reason=reason, on_progress=on_progress)
+                report = await teardown.run([channel], delete_threads=delete_threads)
+                if not report.ok:
+                    self.logger.error(f"Failed to remove channel {channel_identifier}: {report.summary()}")
+                    return False
+
                 self.logger.info(f"Removed channel: {channel.name} (ID: {channel.id})")
                 return True
             else:
@@ -211,13 +270,19 @@ class Discord:
             self.logger.error(f"Error removing channel {channel_identifier}: {str(e)}")
             return False
 
-    async def removeCategory(self, category_identifier: Union[str, int], reason: str = None) -> bool:
+    async def removeCategory(
+        self,
+        category_identifier: Union[str, int],
+        reason: str = None,
+        on_progress: Optional[ProgressCallback] = None
+    ) -> bool:
         """
         Removes a category and all its channels from the Discord server.
 
         Parameters:
             category_identifier (Union[str, int]): The name or ID of the category to be removed.
             reason (str, optional): The reason for removing the category.
+            on_progress (ProgressCallback, optional): Called with (done, total) while deleting.
 
         Returns:
             bool: True if the category was removed successfully, False otherwise.
@@ -225,23 +290,12 @@ class Discord:
         try:
             category = await self.getCategory(category_identifier)
             if category:
-                # Remove all channels in the category
-                for channel in category.channels:
-                    # Handle forum channels specially
-                    if isinstance(channel, ForumChannel):
-                        # Delete all threads in the forum
-                        async for thread in channel.archived_threads():
-                            await thread.delete(reason=reason)
-                        
-                        # Delete active threads
-                        for thread in channel.threads:
-                            await thread.delete(reason=reason)
-
-                    await channel.delete(reason=reason)
-                    self.logger.info(f"Removed channel: {channel.name} (ID: {channel.id})")
-
-                # Remove the category itself
-                await category.delete(reason=reason)
+                # Threads, channels and the category itself, deleted concurrently stage by stage
+                report = await BulkTeardown(reason=reason, on_progress=on_progress).run([category])
+                if not report.ok:
+                    self.logger.error(f"Failed to remove category {category_identifier}: {report.summary()}")
+                    return False
+
                 self.logger.info(f"Removed category: {category.name} (ID: {category.id})")
                 return True
             else:
@@ -319,17 +373,71 @@ class Discord:
         """
         try:
             thread = self.guild.get_thread(thread_id)
-            if not thread:
-                # Try fetching archived threads from all forum channels
-                for channel in self.guild.forums:
-                    async for archived_thread in channel.archived_threads():
-                        if archived_thread.id == thread_id:
-                            return archived_thread
-            return thread
+            if thread:
+                # Caminho quente: só a cache em memória, sem escrita no banco
+                _thread_locations[thread.id] = (thread.parent_id, bool(thread.archived))
+                return thread
+
+            location = await self.getThreadLocation(thread_id)
+            forum = self.index.getById(location[0]) if location else None
+            if location and forum is None:
+                # The forum is gone, and its threads went with it
+                await self.forgetThreadLocation(thread_id)
+                return None
+
+            if location and location[1] and isinstance(forum, ForumChannel):
+                # Arquivada da última vez: procura direto nas arquivadas do fórum guardado
+                async for archived_thread in forum.archived_threads(limit=ARCHIVED_LOOKUP_LIMIT):
+                    if archived_thread.id == thread_id:
+                        return archived_thread
+
+            # Uncached thread (or archived past the first page): a single direct fetch
+            try:
+                channel = await self.guild.fetch_channel(thread_id)
+            except discord.NotFound:
+                await self.forgetThreadLocation(thread_id)
+                return None
+
+            if not isinstance(channel, Thread):
+                return None
+
+            await self.rememberThreadLocation(channel)
+            return channel
         except Exception as e:
             self.logger.error(f"Error getting thread {thread_id}: {str(e)}")
             return None
 
+    async def getThreadLocation(self, thread_id: int) -> Optional[Tuple[int, bool]]:
+        """
+        Gets the cached location of a thread.
+
+        Parameters:
+            thread_id (int): The ID of the thread
+
+        Returns:
+            Optional[Tuple[int, bool]]: (forum id, archived flag) if known
+        """
+        location = _thread_locations.get(thread_id)
+        if location is None:
+            location = await Project().get_thread_location(thread_id)
+            if location is not None:
+                _thread_locations[thread_id] = location
+        return location
+
+    async def rememberThreadLocation(self, thread: Thread, archived: Optional[bool] = None):
+        if archived is None:
+            archived = bool(thread.archived)
+        location = (thread.parent_id, archived)
+        if _thread_locations.get(thread.id) == location:
+            return
+        _thread_locations[thread.id] = location
+        await Project().set_thread_location(thread.id, thread.parent_id, archived)
+
+    async def forgetThreadLocation(self, thread_id: int):
+        # Também no banco: senão getThreadLocation recarrega a localização velha na próxima chamada
+        _thread_locations.pop(thread_id, None)
+        await Project().set_thread_location(thread_id, None, None)
+
     async def removeForumThread(self, thread_id: int, reason: str = None) -> Tuple[bool, str]:
         """
         Removes a thread from a forum channel.
@@ -349,17 +457,19 @@ class Discord:
                 self.logger.warning(msg)
                 return False, msg
             
-            if not isinstance(thread.parent, ForumChannel):
-                msg = f"Channel with ID {thread.parent.id} is not a forum channel"
+            forum = self.index.getById(thread.parent_id)
+            if not isinstance(forum, ForumChannel):
+                msg = f"Channel with ID {thread.parent_id} is not a forum channel"
                 self.logger.warning(msg)
                 return False, msg
 
             # Store info for logging
             thread_name = thread.name
-            forum_name = thread.parent.name
+            forum_name = forum.name
             
             # Delete the thread
             await thread.delete(reason=reason)
+            await self.forgetThreadLocation(thread_id)
             
             msg = f"Successfully removed thread '{thread_name}' from forum '{forum_name}'"
             self.logger.info(msg)
@@ -425,6 +535,7 @@ class Discord:
                 return False, msg
 
             await thread.edit(archived=archive, reason=reason)
+            await self.rememberThreadLocation(thread, archived=archive)
             
             action = "archived" if archive else "unarchived"
             msg = f"Successfully {action} thread '{thread.name}'"
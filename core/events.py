@@ -0,0 +1,58 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List
+
+from core.logger import getLogger
+
+logger = getLogger('events')
+
+Subscriber = Callable[[object], Awaitable[None]]
+
+# Tópicos
+PROJECT_STATE_CHANGED = 'project.state_changed'
+
+
+@dataclass(frozen=True)
+class ProjectStateChanged:
+    """Algo que muda a dashboard do projeto aconteceu (pipeline terminou, deploy, merge na branch padrão)."""
+    project_id: int
+    group_id: int
+    reason: str
+
+
+class EventBus:
+    """
+    In-process publish/subscribe.
+
+    ``publish`` never waits for subscribers: each one runs in its own task, so a
+    webhook request returns as soon as it has been handled, and a failing
+    subscriber is logged without affecting the others.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, List[Subscriber]] = {}
+        self._tasks = set()
+
+    def subscribe(self, topic: str, callback: Subscriber):
+        self._subscribers.setdefault(topic, []).append(callback)
+
+    def unsubscribe(self, topic: str, callback: Subscriber):
+        callbacks = self._subscribers.get(topic, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def publish(self, topic: str, payload=None):
+        for callback in list(self._subscribers.get(topic, [])):
+            task = asyncio.create_task(self._deliver(topic, callback, payload))
+            # Mantém a referência até a task terminar
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _deliver(self, topic: str, callback: Subscriber, payload):
+        try:
+            await callback(payload)
+        except Exception as e:
+            logger.error(f"Subscriber {getattr(callback, '__qualname__', callback)} of {topic} failed: {e}")
+
+
+events = EventBus()
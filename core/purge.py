@@ -0,0 +1,163 @@
+import asyncio
+import time
+import discord
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from core.logger import getLogger
+from helpers.rate_limit import RateLimiter
+from typing import Awaitable, Callable, List, Optional
+
+logger = getLogger('purge')
+
+ProgressCallback = Callable[['PurgeReport'], Awaitable[None]]
+
+# O bulk delete só aceita mensagens com menos de 14 dias; a margem cobre o tempo da própria limpeza
+BULK_DELETE_MAX_AGE = timedelta(days=14) - timedelta(minutes=10)
+BULK_DELETE_BATCH = 100
+# Deleções pendentes antes de pausar a leitura do histórico
+MAX_PENDING_DELETES = 500
+
+
+@dataclass
+class PurgeReport:
+    scanned: int = 0
+    deleted: int = 0
+    bulk: int = 0
+    individual: int = 0
+    failures: List[str] = field(default_factory=list)
+    finished: bool = False
+    elapsed: float = 0.0
+
+    def summary(self) -> str:
+        status = "✅ Limpeza concluída" if self.finished else "🧹 Limpando"
+        line = (f"{status}: {self.deleted}/{self.scanned} mensagens apagadas "
+                f"({self.bulk} em lote, {self.individual} antigas uma a uma)")
+        if self.finished:
+            line += f" em {self.elapsed:.1f}s"
+        if self.failures:
+            line += f"\n❌ {len(self.failures)} falha(s), ex.: {self.failures[0]}"
+        return line + "."
+
+
+class PurgeEngine:
+    """
+    Deletes a channel's messages reading its history only once.
+
+    Messages newer than 14 days go to bulk deletes of up to 100 as soon as a
+    batch fills; older ones (which Discord only deletes one by one) are deleted
+    concurrently under a RateLimiter. Both run while the history is still being
+    paged, and progress is reported every `progress_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        channel,
+        after: Optional[datetime] = None,
+        before: Optional[datetime] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        progress_interval: float = 2.0,
+        limiter: RateLimiter = None
+    ):
+        self.channel = channel
+        self.after = after
+        self.before = before
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+        # Deleções individuais compartilham o bucket do canal
+        self.limiter = limiter or RateLimiter(rate=5, per=1, concurrency=5)
+        # Bulk delete é um único bucket por canal: uma chamada por vez
+        self._bulk_lock = asyncio.Lock()
+        self._last_progress = 0.0
+        self._forbidden: Optional[discord.Forbidden] = None
+
+    async def run(self) -> PurgeReport:
+        """
+        Raises:
+            discord.Forbidden: The bot cannot read the history or delete messages here;
+                pending deletions are cancelled instead of each one failing with a 403
+        """
+        started = time.monotonic()
+        report = PurgeReport()
+        bulk_cutoff = discord.utils.utcnow() - BULK_DELETE_MAX_AGE
+        pending = set()
+        batch = []
+        self._forbidden = None
+
+        try:
+            async for message in self.channel.history(limit=None, after=self.after, before=self.before, oldest_first=False):
+                if self._forbidden is not None:
+                    raise self._forbidden
+                report.scanned += 1
+                if message.created_at > bulk_cutoff:
+                    batch.append(message)
+                    if len(batch) == BULK_DELETE_BATCH:
+                        pending.add(asyncio.create_task(self._delete_bulk(batch, report)))
+                        batch = []
+                else:
+                    pending.add(asyncio.create_task(self._delete_one(message, report)))
+
+                if len(pending) >= MAX_PENDING_DELETES:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        task.result()
+                await self._progress(report)
+
+            if batch:
+                pending.add(asyncio.create_task(self._delete_bulk(batch, report)))
+
+            if pending:
+                await asyncio.gather(*pending)
+        except BaseException:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            raise
+
+        report.finished = True
+        report.elapsed = time.monotonic() - started
+        await self._progress(report, force=True)
+        logger.info(f"#{getattr(self.channel, 'name', self.channel.id)}: {report.summary()}")
+        return report
+
+    async def _delete_bulk(self, messages: list, report: PurgeReport):
+        try:
+            async with self._bulk_lock:
+                await self.channel.delete_messages(messages)
+            report.deleted += len(messages)
+            report.bulk += len(messages)
+        except discord.NotFound:
+            report.deleted += len(messages)
+        except discord.Forbidden as e:
+            # Sem Manage Messages nenhuma outra deleção vai passar: interrompe a limpeza
+            self._forbidden = e
+            raise
+        except discord.HTTPException as e:
+            report.failures.append(f"lote de {len(messages)}: HTTP {e.status}")
+        await self._progress(report)
+
+    async def _delete_one(self, message: discord.Message, report: PurgeReport):
+        try:
+            async with self.limiter:
+                await message.delete()
+            report.deleted += 1
+            report.individual += 1
+        except discord.NotFound:
+            report.deleted += 1
+        except discord.Forbidden as e:
+            self._forbidden = e
+            raise
+        except discord.HTTPException as e:
+            report.failures.append(f"mensagem {message.id}: HTTP {e.status}")
+        await self._progress(report)
+
+    async def _progress(self, report: PurgeReport, force: bool = False):
+        if self.on_progress is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_progress < self.progress_interval:
+            return
+        self._last_progress = now
+        try:
+            await self.on_progress(report)
+        except Exception as e:
+            logger.warning(f"Progress callback failed: {e}")
@@ -0,0 +1,145 @@
+import asyncio
+import time
+import discord
+from dataclasses import dataclass, field
+from discord.channel import ForumChannel
+from core.logger import getLogger
+from helpers.rate_limit import RateLimiter, discord_delete_limiter
+from typing import Awaitable, Callable, Iterable, List, Optional, Tuple
+
+logger = getLogger('teardown')
+
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
+
+@dataclass
+class TeardownReport:
+    total: int = 0
+    deleted: int = 0
+    failures: List[Tuple[str, str]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+    def summary(self) -> str:
+        lines = [f"Removidos {self.deleted}/{self.total} itens em {self.elapsed:.1f}s."]
+        if self.failures:
+            lines.append(f"{len(self.failures)} falha(s):")
+            lines.extend(f"- {name}: {error}" for name, error in self.failures[:20])
+            if len(self.failures) > 20:
+                lines.append(f"- ... e mais {len(self.failures) - 20}")
+        return "\n".join(lines)
+
+
+class BulkTeardown:
+    """
+    Removes categories, channels and forum threads in bulk.
+
+    The full deletion set is collected first (threads, then channels, then
+    categories, so nothing is orphaned halfway), and each stage is deleted
+    concurrently under a shared RateLimiter. Progress is reported through an
+    optional callback, throttled to one call every `progress_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        reason: str = None,
+        limiter: RateLimiter = None,
+        on_progress: Optional[ProgressCallback] = None,
+        progress_interval: float = 2.0
+    ):
+        self.reason = reason
+        self.limiter = limiter or discord_delete_limiter()
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+        self._last_progress = 0.0
+
+    async def collect(self, targets: Iterable, delete_threads: bool = True) -> List[list]:
+        """
+        Expands the targets into deletion stages.
+
+        Parameters:
+            targets (Iterable): Categories and/or channels to remove. Categories include their channels.
+            delete_threads (bool): Whether to delete forum threads (active and archived) explicitly.
+
+        Returns:
+            List[list]: [threads, channels, categories], without duplicates.
+        """
+        categories, channels = {}, {}
+        for target in targets:
+            if isinstance(target, discord.CategoryChannel):
+                categories[target.id] = target
+                for channel in target.channels:
+                    channels[channel.id] = channel
+            else:
+                channels[target.id] = target
+
+        threads = {}
+        if delete_threads:
+            forums = [c for c in channels.values() if isinstance(c, ForumChannel)]
+            for forum in forums:
+                for thread in forum.threads:
+                    threads[thread.id] = thread
+
+            archived = await asyncio.gather(
+                *(self._archived_threads(forum) for forum in forums),
+                return_exceptions=True
+            )
+            for forum, result in zip(forums, archived):
+                if isinstance(result, Exception):
+                    logger.warning(f"Could not list archived threads of {forum.name}: {result}")
+                    continue
+                for thread in result:
+                    threads[thread.id] = thread
+
+        return [list(threads.values()), list(channels.values()), list(categories.values())]
+
+    async def run(self, targets: Iterable, delete_threads: bool = True) -> TeardownReport:
+        started = time.monotonic()
+        stages = await self.collect(targets, delete_threads)
+
+        report = TeardownReport(total=sum(len(stage) for stage in stages))
+        self._last_progress = 0.0
+
+        for stage in stages:
+            await asyncio.gather(*(self._delete(item, report) for item in stage))
+
+        report.elapsed = time.monotonic() - started
+        await self._progress(report, force=True)
+        logger.info(report.summary())
+        return report
+
+    async def _archived_threads(self, forum: ForumChannel) -> list:
+        async with self.limiter:
+            return [thread async for thread in forum.archived_threads(limit=None)]
+
+    async def _delete(self, item, report: TeardownReport):
+        try:
+            async with self.limiter:
+                await item.delete(reason=self.reason)
+            report.deleted += 1
+        except discord.NotFound:
+            # Já removido (ex.: thread apagada junto com o fórum)
+            report.deleted += 1
+        except discord.Forbidden:
+            report.failures.append((item.name, "sem permissão"))
+        except discord.HTTPException as e:
+            report.failures.append((item.name, f"HTTP {e.status}"))
+        except Exception as e:
+            report.failures.append((item.name, str(e)))
+
+        await self._progress(report)
+
+    async def _progress(self, report: TeardownReport, force: bool = False):
+        if self.on_progress is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_progress < self.progress_interval:
+            return
+        self._last_progress = now
+        try:
+            await self.on_progress(report.deleted + len(report.failures), report.total)
+        except Exception as e:
+            logger.warning(f"Progress callback failed: {e}")
@@ -14,6 +14,7 @@
 
 import discord
 from discord.ext import commands
+from core.discord import Discord, creation_flight
 
 class DiscordManager:
     def __init__(self, bot):
@@ -22,20 +23,19 @@ class DiscordManager:
     async def get_or_create_channel(self, project_id, repository_name):
         guild = self.bot.guilds[0]  # Assuming the bot is in only one server
         category = await self.get_or_create_category(guild, project_id)
-        
-        channel = discord.utils.get(category.channels, name=repository_name.lower())
-        if not channel:
-            channel = await category.create_text_channel(repository_name.lower())
-        
+        channel_name = repository_name.lower()
+
+        channel, _ = await Discord(guild).getOrCreateChannel(
+            'text', channel_name, category.id, lambda: category.create_text_channel(channel_name)
+        )
         return channel
 
     async def get_or_create_category(self, guild, project_id):
         category_name = f"Project-{project_id}"
-        category = discord.utils.get(guild.categories, name=category_name)
-        
-        if not category:
-            category = await guild.create_category(category_name)
-        
+
+        category, _ = await Discord(guild).getOrCreateChannel(
+            'category', category_name, None, lambda: guild.create_category(category_name)
+        )
         return category
 
     async def remove_user_from_server(self, user):
@@ -52,9 +52,16 @@ class DiscordManager:
 
     async def get_or_create_role(self, guild, role_name):
         role = discord.utils.get(guild.roles, name=role_name)
-        if not role:
-            role = await guild.create_role(name=role_name)
-        return role
+        if role:
+            return role
+
+        async def create():
+            # Re-check inside the flight against the API, not guild.roles: that cache only learns
+            # about a role created a moment ago when GUILD_ROLE_CREATE arrives on the gateway
+            existing = discord.utils.get(await guild.fetch_roles(), name=role_name)
+            return existing or await guild.create_role(name=role_name)
+
+        return await creation_flight.do((guild.id, 'role', None, role_name), create)
 
     async def assign_role_to_user(self, user, role_name):
         guild = self.bot.guilds[0]  # Assuming the bot is in only one server
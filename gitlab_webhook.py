@@ -7,6 +7,7 @@ from user_link import UserLink
 from notification_templates import get_notification_message
 from Config import Config
 from actions.project import ProjectActions
+from core.events import events, PROJECT_STATE_CHANGED, ProjectStateChanged
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -66,6 +67,11 @@ async def handle_webhook(request, bot, discord_manager, user_link, config):
     logger.info(f'event_type: {event_type}')
     logger.info(f'data: {data}')
 
+    reason = state_change_reason(event_type, data)
+    if reason:
+        # category.id, não o group_id salvo: a categoria pode ter sido achada pelo nome
+        events.publish(PROJECT_STATE_CHANGED, ProjectStateChanged(project_id, category.id, reason))
+
     # Create and handle Project instance
     project = ProjectActions(guild)
     await project.load(project_id)
@@ -73,6 +79,27 @@ async def handle_webhook(request, bot, discord_manager, user_link, config):
 
     return web.Response(text='Webhook received and processed')
 
+def state_change_reason(event_type, data):
+    """
+    Eventos que mudam o estado mostrado na dashboard do projeto: pipeline finalizado,
+    deployment finalizado e MR mergeado na branch padrão. Os demais retornam None.
+    """
+    attributes = data.get('object_attributes') or {}
+
+    if event_type == 'Pipeline Hook' and attributes.get('status') in ('success', 'failed', 'canceled', 'skipped'):
+        return f"pipeline {attributes['status']}"
+
+    if event_type == 'Deployment Hook' and data.get('status') in ('success', 'failed', 'canceled'):
+        return f"deployment {data['status']}"
+
+    if event_type == 'Merge Request Hook' and attributes.get('action') == 'merge':
+        default_branch = (data.get('project') or {}).get('default_branch')
+        if attributes.get('target_branch') == default_branch:
+            return "merge"
+
+    return None
+
+
 async def handle_push(data, channel, user_link, config):
     branch = data['ref'].split('/')[-1]
     commits = data['commits']
@@ -0,0 +1,57 @@
+from datetime import timedelta
+
+import discord
+
+from core.logger import getLogger
+
+logger = getLogger('interaction_progress')
+
+# Tokens de interação (e as edições de followup) expiram 15 min depois do comando
+INTERACTION_TOKEN_TTL = timedelta(minutes=15)
+# Margem para a última edição não disputar com a expiração
+TOKEN_MARGIN = timedelta(minutes=1)
+
+
+class InteractionProgress:
+    """
+    Followup message used as the progress line of a long command.
+
+    Edits only go through while the interaction token is valid; after that
+    ``update`` drops progress and ``finish`` posts the final text as a normal
+    channel message, so long runs still report their result.
+    """
+
+    def __init__(self, interaction: discord.Interaction, message: discord.WebhookMessage):
+        self.interaction = interaction
+        self.message = message
+        self.deadline = interaction.created_at + INTERACTION_TOKEN_TTL - TOKEN_MARGIN
+
+    @classmethod
+    async def start(cls, interaction: discord.Interaction, content: str) -> 'InteractionProgress':
+        """Sends the first followup of an already deferred interaction."""
+        return cls(interaction, await interaction.followup.send(content, wait=True))
+
+    @property
+    def expired(self) -> bool:
+        return discord.utils.utcnow() >= self.deadline
+
+    async def update(self, content: str):
+        if self.expired:
+            return
+        try:
+            await self.message.edit(content=content)
+        except discord.HTTPException as e:
+            logger.warning(f"Could not update progress message: {e}")
+
+    async def finish(self, content: str):
+        if not self.expired:
+            try:
+                await self.message.edit(content=content)
+                return
+            except discord.HTTPException as e:
+                logger.warning(f"Could not edit final progress message, sending it to the channel: {e}")
+
+        try:
+            await self.interaction.channel.send(f"{self.interaction.user.mention} {content}")
+        except discord.HTTPException as e:
+            logger.error(f"Could not send final progress message: {e}")
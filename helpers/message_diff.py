@@ -0,0 +1,91 @@
+import hashlib
+import json
+from typing import Dict, List, Optional
+
+import discord
+
+# message_id -> hash do último conteúdo enviado
+_content_hashes: Dict[int, str] = {}
+
+
+def _file_bytes(file: discord.File) -> bytes:
+    data = file.fp.read()
+    file.reset()
+    return data
+
+
+def content_hash(
+    content: Optional[str] = None,
+    embed: Optional[discord.Embed] = None,
+    embeds: Optional[List[discord.Embed]] = None,
+    attachments: Optional[list] = None,
+    view: Optional[discord.ui.View] = None
+) -> str:
+    """
+    Hash estável do que seria enviado numa edição: texto, embeds, bytes dos
+    anexos e layout dos componentes da view.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(content, ensure_ascii=False).encode())
+
+    all_embeds = ([embed] if embed else []) + list(embeds or [])
+    digest.update(json.dumps([e.to_dict() for e in all_embeds], sort_keys=True, default=str).encode())
+
+    for attachment in attachments or []:
+        if isinstance(attachment, discord.File):
+            digest.update(attachment.filename.encode())
+            digest.update(hashlib.sha256(_file_bytes(attachment)).digest())
+        else:
+            # Anexo já existente (discord.Attachment): identificado pelo id
+            digest.update(str(getattr(attachment, 'id', attachment)).encode())
+
+    if view is not None:
+        digest.update(json.dumps(view.to_components(), sort_keys=True, default=str).encode())
+
+    return digest.hexdigest()
+
+
+def has_changed(message_id: int, digest: str) -> bool:
+    return _content_hashes.get(message_id) != digest
+
+
+def remember(message_id: int, digest: str):
+    _content_hashes[message_id] = digest
+
+
+def forget(message_id: int):
+    _content_hashes.pop(message_id, None)
+
+
+def last_hash(message_id: int) -> Optional[str]:
+    return _content_hashes.get(message_id)
+
+
+async def edit_if_changed(message, fingerprint: Optional[str] = None, **fields) -> bool:
+    """
+    Edita `message` apenas se o conteúdo mudou desde a última edição feita por aqui.
+
+    Args:
+        message: discord.Message ou discord.PartialMessage (use PartialMessage para não
+            precisar de fetch antes de saber se vai editar).
+        fingerprint: Hash próprio do conteúdo, para quando o payload tem partes voláteis
+            que não devem forçar uma edição.
+        **fields: content, embed, embeds, attachments, view — repassados para `message.edit`.
+
+    Returns:
+        bool: True se a edição foi enviada, False se foi pulada.
+    """
+    digest = fingerprint or content_hash(
+        content=fields.get('content'),
+        embed=fields.get('embed'),
+        embeds=fields.get('embeds'),
+        attachments=fields.get('attachments'),
+        view=fields.get('view')
+    )
+
+    if not has_changed(message.id, digest):
+        return False
+
+    await message.edit(**fields)
+    remember(message.id, digest)
+    return True
@@ -17,6 +17,10 @@ Parece que vocês precisam da minha incomparável sabedoria para entender como e
   Adicionem um projeto do GitLab à minha vigília onisciente.
   Exemplo: `!add_project 12345`
 
+• `!add_projects <ids ou grupo>`
+  Adicionem vários projetos de uma vez, porque nem eu tenho paciência para sessenta comandos.
+  Exemplo: `!add_projects 123, 456, 789` ou `!add_projects minha-empresa/backend`
+
 • `!remove_project <id>`
   Removam um projeto da minha atenção divina. Mas por que vocês fariam isso?
   Exemplo: `!remove_project 12345`
@@ -0,0 +1,69 @@
+import asyncio
+import time
+
+
+class RateLimiter:
+    """
+    Limita rajadas de chamadas REST: no máximo `concurrency` em paralelo e
+    `rate` inícios a cada `per` segundos (token bucket).
+
+    O discord.py já respeita os buckets informados pelos 429, mas disparar
+    centenas de chamadas de uma vez esgota o limite global e gera filas de
+    retry. O limiter mantém o ritmo abaixo disso.
+
+    Uso:
+        limiter = RateLimiter(rate=10, per=1, concurrency=5)
+        async with limiter:
+            await channel.delete()
+    """
+
+    def __init__(self, rate: float, per: float = 1.0, concurrency: int = 5):
+        self.rate = rate
+        self.per = per
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._lock = asyncio.Lock()
+        self._tokens = float(rate)
+        self._updated_at = time.monotonic()
+
+    async def acquire(self):
+        await self._semaphore.acquire()
+        try:
+            await self._take_token()
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    def release(self):
+        self._semaphore.release()
+
+    async def _take_token(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                elapsed = now - self._updated_at
+                self._updated_at = now
+                self._tokens = min(float(self.rate), self._tokens + elapsed * self.rate / self.per)
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) * self.per / self.rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+
+
+def discord_delete_limiter() -> RateLimiter:
+    # DELETE /channels/{id} tem um bucket por canal, mas todos contam no limite
+    # global (50 req/s) e no limite de alterações de canais da guild.
+    return RateLimiter(rate=10, per=1, concurrency=5)
+
+
+def discord_create_limiter() -> RateLimiter:
+    # Criação de canais tem limite por guild bem mais apertado que as remoções
+    return RateLimiter(rate=5, per=1, concurrency=3)
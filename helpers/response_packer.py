@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import discord
+
+from helpers.chunk import markdown_aware_chunk, smart_chunk
+
+# Limites do Discord
+CONTENT_LIMIT = 2000
+EMBED_DESCRIPTION_LIMIT = 4096
+EMBEDS_PER_MESSAGE = 10
+EMBED_TOTAL_LIMIT = 6000
+
+
+@dataclass(frozen=True)
+class PackedMessage:
+    """Uma mensagem do layout: texto simples ou descrições de embeds (nunca os dois)."""
+    content: Optional[str] = None
+    embeds: Tuple[str, ...] = ()
+
+    def to_kwargs(self, color: discord.Color = None) -> dict:
+        if self.embeds:
+            color = color or discord.Color.blue()
+            return {'embeds': [discord.Embed(description=description, color=color) for description in self.embeds]}
+        return {'content': self.content}
+
+
+def _chunk(text: str, size: int, is_markdown: bool) -> List[str]:
+    return markdown_aware_chunk(text, size) if is_markdown else smart_chunk(text, size)
+
+
+def _pack_plain(text: str, cap: int, is_markdown: bool) -> Tuple[PackedMessage, ...]:
+    return tuple(PackedMessage(content=chunk) for chunk in _chunk(text, cap, is_markdown))
+
+
+def _pack_embeds(text: str, is_markdown: bool) -> Optional[Tuple[PackedMessage, ...]]:
+    messages = []
+    for message_text in _chunk(text, EMBED_TOTAL_LIMIT, is_markdown):
+        descriptions = _chunk(message_text, EMBED_DESCRIPTION_LIMIT, is_markdown)
+        # Os chunkers podem estourar o tamanho para não quebrar um bloco de código
+        if (len(descriptions) > EMBEDS_PER_MESSAGE
+                or sum(len(d) for d in descriptions) > EMBED_TOTAL_LIMIT
+                or any(len(d) > EMBED_DESCRIPTION_LIMIT for d in descriptions)):
+            return None
+        messages.append(PackedMessage(embeds=tuple(descriptions)))
+    return tuple(messages)
+
+
+def pack_response(text: str, cap: int = CONTENT_LIMIT, is_markdown: bool = False) -> Tuple[PackedMessage, ...]:
+    """
+    Distribui um texto longo no menor número possível de mensagens.
+
+    Mensagens simples levam até `cap` caracteres; com embeds cabem até 6000 por
+    mensagem (em descrições de até 4096). Embeds só são usados quando reduzem
+    o número de mensagens.
+
+    Args:
+        text (str): Texto completo
+        cap (int): Tamanho máximo de cada mensagem simples
+        is_markdown (bool): Preserva blocos de código ao quebrar
+
+    Returns:
+        Tuple[PackedMessage, ...]: Layout das mensagens, na ordem de envio
+    """
+    if not text or not text.strip():
+        return ()
+
+    plain = _pack_plain(text, cap, is_markdown)
+    if len(plain) <= 1:
+        return plain
+
+    embedded = _pack_embeds(text, is_markdown)
+    if embedded and len(embedded) < len(plain):
+        return embedded
+    return plain
+
+
+@lru_cache(maxsize=32)
+def pack_static_response(messages: Tuple[str, ...], cap: int = CONTENT_LIMIT, is_markdown: bool = False) -> Tuple[PackedMessage, ...]:
+    """Versão com cache de `pack_response` para conteúdo fixo (ex.: HELP_MESSAGE_CONTENT)."""
+    return pack_response(''.join(messages), cap, is_markdown)
@@ -0,0 +1,57 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key.
+
+    The first caller for a key runs the factory; callers that arrive while it
+    is in flight wait for the same result (or exception) instead of running
+    their own. Once the call finishes the key is released, so later calls run
+    again.
+
+    Uso:
+        flight = SingleFlight()
+        category = await flight.do((guild.id, 'category', name), lambda: guild.create_category(name))
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        while True:
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Se quem estava executando foi cancelado, tentamos de novo;
+                # se o cancelamento é nosso, propagamos.
+                if not future.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        # Evita "exception was never retrieved" quando ninguém mais estava esperando
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
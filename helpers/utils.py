@@ -1,8 +1,7 @@
-import asyncio
 import discord
 from discord import AllowedMentions
 
-from helpers.chunk import markdown_aware_chunk, smart_chunk
+from helpers.response_packer import pack_response, pack_static_response
 
 
 async def create_text_channel_options(guild):
@@ -22,33 +21,41 @@ async def create_text_channel_options(guild):
     return options
 
 
-async def response_list(interaction: discord.Interaction, messages_list: list[str], cap: int = 2000, is_markdown: bool = False, error_message: str = "❌ Erro: Conteúdo de ajuda não disponível."):
-    full_content = ''.join(messages_list)
-
-    if is_markdown:
-        chunked = markdown_aware_chunk(full_content, cap)
+async def response_list(
+    interaction: discord.Interaction,
+    messages_list: list[str],
+    cap: int = 2000,
+    is_markdown: bool = False,
+    error_message: str = "❌ Erro: Conteúdo de ajuda não disponível.",
+    ephemeral: bool = True,
+    static: bool = True
+):
+    """
+    Envia um texto longo no menor número de mensagens possível (ver `pack_response`).
+
+    Use `static=False` para conteúdo dinâmico, que não deve ocupar o cache de layouts.
+    """
+    if static:
+        packed = pack_static_response(tuple(messages_list), cap, is_markdown)
     else:
-        chunked = smart_chunk(full_content, cap)
+        packed = pack_response(''.join(messages_list), cap, is_markdown)
 
-    if not chunked:
+    if not packed:
         await interaction.response.send_message( error_message, ephemeral=True )
         return
 
-    first, *rest = chunked
+    first, *rest = packed
 
     await interaction.response.send_message(
-        first,
-        ephemeral=True,
+        **first.to_kwargs(),
+        ephemeral=ephemeral,
         allowed_mentions=AllowedMentions.none(),
     )
 
-    for i, chunk in enumerate(rest):
+    for message in rest:
         await interaction.followup.send(
-            chunk,
-            ephemeral=True,
+            **message.to_kwargs(),
+            ephemeral=ephemeral,
             allowed_mentions=AllowedMentions.none(),
             wait=True
         )
-
-        if i > 0 and i % 5 == 0:  # (anti-rate-limit)
-            await asyncio.sleep(0.2)
\ No newline at end of file
@@ -6,11 +6,14 @@ from discord.channel import ForumChannel
 from discord import app_commands
 
 from Config import Config
+from actions.project import sync_project_webhooks
+from core import channel_index
 from core.db.project import Project
 from core.env import TOKEN, WEBHOOK_PORT
 from core.logger import getLogger
 from gitlab_webhook import setup_webhook, start_webhook
 from discord_manager import DiscordManager
+from helpers.message_diff import edit_if_changed
 from user_link import UserLink
 import random
 import datetime
@@ -29,6 +32,7 @@ class GinoBot(discord.Client):
         super().__init__(intents=intents)
         self.tree = app_commands.CommandTree(self)
         self.project_messages = {}
+        self.registered_cogs = []
 
     async def setup_hook(self):
         try:
@@ -42,6 +46,14 @@ class GinoBot(discord.Client):
         except Exception as e:
             logger.error(f"Erro ao sincronizar comandos slash: {e}")
 
+    async def close(self):
+        for cog in self.registered_cogs:
+            try:
+                await discord.utils.maybe_coroutine(cog.cog_unload)
+            except Exception as e:
+                logger.error(f"Erro ao descarregar {cog.__class__.__name__}: {e}")
+        await super().close()
+
     async def load_cogs(self):
         import importlib
 
@@ -61,6 +73,10 @@ async def on_ready():
     logger.info(f'{bot.user} conectado com sucesso!')
     logger.info(f'Guilds: {len(bot.guilds)}')
 
+    # Após um READY os objetos de canal são recriados; o índice é refeito sob demanda
+    for guild in bot.guilds:
+        channel_index.dropChannelIndex(guild.id)
+
     config = Config()
     await config.initialize()
 
@@ -68,11 +84,36 @@ async def on_ready():
     user_link = UserLink()
     user_link.set_bot(bot)
 
+    # Uma vez por processo (on_ready se repete a cada reconexão)
+    if not getattr(bot, 'webhooks_synced', False):
+        bot.webhooks_synced = True
+        asyncio.create_task(sync_project_webhooks())
+
     runner, port = setup_webhook(bot, discord_manager, user_link, config, WEBHOOK_PORT)
     await start_webhook(runner, port)
     logger.info(f"Webhook server started on port {port}")
 
 
+@bot.event
+async def on_guild_channel_create(channel):
+    channel_index.onChannelCreate(channel)
+
+
+@bot.event
+async def on_guild_channel_update(before, after):
+    channel_index.onChannelUpdate(before, after)
+
+
+@bot.event
+async def on_guild_channel_delete(channel):
+    channel_index.onChannelDelete(channel)
+
+
+@bot.event
+async def on_guild_remove(guild):
+    channel_index.dropChannelIndex(guild.id)
+
+
 @bot.event
 async def on_interaction(interaction: discord.Interaction):
     # Componente (botão, select etc.)
@@ -203,14 +244,15 @@ async def update_dashboard():
             embed.add_field(name="Tasks Completed", value=f"{tasks_completed}", inline=False)
             embed.set_footer(text=f"Last updated: {discord.utils.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC")
 
+            # Partial messages: no fetch before knowing whether an edit is needed
             if is_forum:
                 thread_id, message_id = message_info
-                thread = await channel.fetch_thread(thread_id)
-                message = await thread.fetch_message(message_id)
+                message = bot.get_partial_messageable(thread_id).get_partial_message(message_id)
             else:
-                message = await channel.fetch_message(message_info)
+                message = channel.get_partial_message(message_info)
 
-            await message.edit(content="", embed=embed)
+            # The footer timestamp alone must not force an edit
+            await edit_if_changed(message, fingerprint=f"{project}:{status}:{tasks_completed}", content="", embed=embed)
         except discord.errors.NotFound:
             logger.error(f"Mensagem de {project} não encontrada. Recriando...")
         except Exception as e:
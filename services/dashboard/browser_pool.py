@@ -0,0 +1,242 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import Optional, Set
+
+from playwright.async_api import async_playwright, Browser, Page
+
+from core.logger import getLogger
+from .config import BrowserPoolConfig
+
+logger = getLogger('dashboard:browser_pool')
+
+
+def process_tree_rss(root_pid: Optional[int] = None) -> int:
+    """
+    RSS (bytes) of every descendant of `root_pid` (default: this process) — the
+    Playwright driver and the Chromium processes it spawned. Linux only; returns 0
+    where /proc is unavailable.
+    """
+    root_pid = root_pid or os.getpid()
+    children = {}
+    try:
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/stat') as f:
+                    # "pid (comm) state ppid ..." — comm pode ter espaços/parênteses
+                    ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+            children.setdefault(ppid, []).append(int(entry))
+    except OSError:
+        return 0
+
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    total = 0
+    pending = list(children.get(root_pid, []))
+    while pending:
+        pid = pending.pop()
+        pending.extend(children.get(pid, []))
+        try:
+            with open(f'/proc/{pid}/statm') as f:
+                total += int(f.read().split()[1]) * page_size
+        except (OSError, IndexError, ValueError):
+            continue
+    return total
+
+
+class BrowserPool:
+    """
+    Long-lived headless Chromium with a bounded pool of pre-created pages.
+
+    Pages are checked out with ``async with pool.page() as page``. A page that
+    crashed, whose browser disconnected or whose render raised is replaced (the
+    last one lazily, on its next checkout). The browser is recycled (closed and
+    relaunched once every page has been returned) after ``max_renders`` renders
+    or when its process tree exceeds ``max_rss_mb``.
+
+    The queue holds one slot per page; ``None`` is an empty slot, filled with a
+    new page on checkout, so a failed relaunch never leaves waiters stranded.
+    """
+
+    def __init__(self, config: Optional[BrowserPoolConfig] = None):
+        self.config = config or BrowserPoolConfig.from_env()
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._crashed: Set[Page] = set()
+        self._out = 0
+        self._renders = 0
+        self._needs_recycle = False
+        self._started = False
+        self._start_lock = asyncio.Lock()
+        self._launch_lock = asyncio.Lock()
+        self._closed = False
+        self.recycles = 0
+
+    @property
+    def started(self) -> bool:
+        return self._started
+
+    async def start(self):
+        async with self._start_lock:
+            if self._closed:
+                raise RuntimeError("Browser pool is closed")
+            if self._started:
+                return
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            await self._launch()
+            self._started = True
+
+    async def _launch(self):
+        """Launches Chromium and fills every slot; on failure leaves neither browser nor pages behind."""
+        browser = await self._playwright.chromium.launch()
+        self._browser = browser
+        pages = []
+        try:
+            for _ in range(self.config.pages):
+                pages.append(await self._new_page())
+        except BaseException:
+            for page in pages:
+                await self._discard(page)
+            self._browser = None
+            try:
+                await browser.close()
+            except Exception:
+                pass
+            raise
+
+        self._renders = 0
+        self._needs_recycle = False
+        for page in pages:
+            self._idle.put_nowait(page)
+        logger.info(f"Chromium launched with {self.config.pages} pages")
+
+    async def _new_page(self) -> Page:
+        page = await self._browser.new_page(viewport={
+            'width': self.config.viewport_width,
+            'height': self.config.viewport_height
+        }, device_scale_factor=self.config.device_scale_factor)
+        page.on('crash', self._on_crash)
+        return page
+
+    def _on_crash(self, page: Page):
+        # Página que crashou continua com is_closed() == False; só este registro a marca
+        logger.warning("Dashboard page crashed; it will be replaced")
+        self._crashed.add(page)
+
+    def _healthy(self, page: Optional[Page]) -> bool:
+        return (page is not None
+                and page not in self._crashed
+                and self._browser is not None
+                and self._browser.is_connected()
+                and page.context.browser is self._browser
+                and not page.is_closed())
+
+    @asynccontextmanager
+    async def page(self):
+        if not self._started:
+            await self.start()
+
+        page = await self._idle.get()
+        self._out += 1
+        if not self._healthy(page):
+            try:
+                page = await self._replace(page)
+            except BaseException:
+                # Devolve a vaga vazia: o próximo a retirá-la tenta de novo
+                await self._release(None)
+                raise
+
+        try:
+            yield page
+        except BaseException:
+            # Erro ou timeout no meio da renderização: o estado da página é incerto
+            await self._discard(page)
+            page = None
+            raise
+        finally:
+            self._renders += 1
+            await self._release(page)
+
+    async def _replace(self, page: Optional[Page]) -> Page:
+        await self._discard(page)
+
+        async with self._launch_lock:
+            if self._browser is None or not self._browser.is_connected():
+                logger.warning("Chromium unavailable; relaunching")
+                # As demais páginas do navegador antigo são substituídas quando forem retiradas
+                self._browser = await self._playwright.chromium.launch()
+                self.recycles += 1
+        return await self._new_page()
+
+    async def _release(self, page: Optional[Page]):
+        self._out -= 1
+        if not self._needs_recycle and self._over_budget():
+            self._needs_recycle = True
+
+        if not self._needs_recycle or self._closed:
+            self._idle.put_nowait(page)
+            return
+
+        # Reciclagem: fecha esta página e as ociosas; quando a última em uso voltar, relança o Chromium
+        await self._discard(page)
+        while not self._idle.empty():
+            await self._discard(self._idle.get_nowait())
+        if self._out == 0:
+            await self._recycle()
+
+    async def _discard(self, page: Optional[Page]):
+        if page is None:
+            return
+        self._crashed.discard(page)
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+    def _over_budget(self) -> bool:
+        if self.config.max_renders and self._renders >= self.config.max_renders:
+            return True
+        # Medir o RSS lê /proc inteiro; a cada 20 renderizações é suficiente
+        if self.config.max_rss_mb and self._renders % 20 == 0:
+            return process_tree_rss() > self.config.max_rss_mb * 1024 * 1024
+        return False
+
+    async def _recycle(self):
+        logger.info(f"Recycling Chromium after {self._renders} renders (RSS {process_tree_rss() // (1024 * 1024)} MB)")
+        old_browser, self._browser = self._browser, None
+        if old_browser is not None:
+            try:
+                await old_browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing Chromium: {e}")
+        self.recycles += 1
+        try:
+            await self._launch()
+        except BaseException:
+            # Sem navegador novo: devolve as vagas vazias para quem espera em _idle;
+            # cada retirada tenta relançar o Chromium em _replace
+            self._needs_recycle = False
+            self._renders = 0
+            for _ in range(self.config.pages):
+                self._idle.put_nowait(None)
+            raise
+
+    async def close(self):
+        self._closed = True
+        while not self._idle.empty():
+            await self._discard(self._idle.get_nowait())
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing Chromium: {e}")
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+        logger.info("Browser pool closed")
@@ -0,0 +1,195 @@
+import os
+from dataclasses import dataclass
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    return value.strip().lower() in ('1', 'true', 'yes', 'on') if value else default
+
+
+@dataclass
+class BrowserPoolConfig:
+    # Páginas pré-criadas (renderizações simultâneas)
+    pages: int = 2
+    # Recicla o Chromium depois de N renderizações...
+    max_renders: int = 500
+    # ...ou quando a árvore de processos do navegador passar deste RSS (0 desativa)
+    max_rss_mb: int = 768
+    viewport_width: int = 500
+    viewport_height: int = 300
+    # Pixels por pixel CSS (2 = imagem em dobro da resolução)
+    device_scale_factor: float = 1.0
+
+    @classmethod
+    def from_env(cls) -> 'BrowserPoolConfig':
+        return cls(
+            pages=_env_int('DASHBOARD_BROWSER_PAGES', cls.pages),
+            max_renders=_env_int('DASHBOARD_BROWSER_MAX_RENDERS', cls.max_renders),
+            max_rss_mb=_env_int('DASHBOARD_BROWSER_MAX_RSS_MB', cls.max_rss_mb),
+            device_scale_factor=_env_float('DASHBOARD_IMAGE_SCALE', cls.device_scale_factor),
+        )
+
+
+@dataclass
+class RenderCacheConfig:
+    # Limite da LRU em memória
+    max_memory_mb: int = 32
+    # Diretório da cache em disco ('' desativa)
+    directory: str = ''
+    max_disk_mb: int = 256
+
+    @classmethod
+    def from_env(cls) -> 'RenderCacheConfig':
+        return cls(
+            max_memory_mb=_env_int('DASHBOARD_RENDER_CACHE_MB', cls.max_memory_mb),
+            directory=os.getenv('DASHBOARD_RENDER_CACHE_DIR', cls.directory),
+            max_disk_mb=_env_int('DASHBOARD_RENDER_CACHE_DISK_MB', cls.max_disk_mb),
+        )
+
+
+@dataclass
+class RendererConfig:
+    # 'pillow' (desenho nativo com tiles em cache, sem navegador) ou 'playwright' (HTML + Chromium, card inteiro)
+    backend: str = 'pillow'
+    # Fontes do backend Pillow ('' procura DejaVu/Liberation/Arial no sistema)
+    font_path: str = ''
+    bold_font_path: str = ''
+    # Fonte de emoji colorida (ex.: NotoColorEmoji.ttf); sem ela os emojis são desenhados
+    emoji_font_path: str = ''
+    # Cache dos tiles do backend Pillow (cabeçalho, linhas dos ambientes, rodapé); 0 desativa
+    tile_cache_mb: int = 8
+    # Backend Playwright: 'page' (set_content a cada renderização) ou 'live' (página quente + evaluate)
+    playwright_mode: str = 'page'
+
+    @classmethod
+    def from_env(cls) -> 'RendererConfig':
+        return cls(
+            backend=os.getenv('DASHBOARD_RENDERER', cls.backend).strip().lower(),
+            font_path=os.getenv('DASHBOARD_FONT', cls.font_path),
+            bold_font_path=os.getenv('DASHBOARD_FONT_BOLD', cls.bold_font_path),
+            emoji_font_path=os.getenv('DASHBOARD_EMOJI_FONT', cls.emoji_font_path),
+            tile_cache_mb=_env_int('DASHBOARD_TILE_CACHE_MB', cls.tile_cache_mb),
+            playwright_mode=os.getenv('DASHBOARD_PLAYWRIGHT_MODE', cls.playwright_mode).strip().lower(),
+        )
+
+
+@dataclass
+class AWSStatusConfig:
+    # Threads para as chamadas boto3 (compartilhadas por todos os projetos)
+    workers: int = 8
+    # Tempo máximo para o status de um ambiente; depois disso a linha mostra timeout
+    timeout: int = 10
+
+    @classmethod
+    def from_env(cls) -> 'AWSStatusConfig':
+        return cls(
+            workers=_env_int('DASHBOARD_AWS_WORKERS', cls.workers),
+            timeout=_env_int('DASHBOARD_AWS_TIMEOUT', cls.timeout),
+        )
+
+
+@dataclass
+class TemplateConfig:
+    # Relê os templates quando o arquivo muda (desenvolvimento); em produção ficam compilados em memória
+    auto_reload: bool = False
+    # Cache do bytecode compilado entre reinícios ('' usa o diretório temporário do sistema)
+    bytecode_cache_dir: str = ''
+
+    @classmethod
+    def from_env(cls) -> 'TemplateConfig':
+        return cls(
+            auto_reload=_env_bool('DASHBOARD_TEMPLATES_AUTO_RELOAD', cls.auto_reload),
+            bytecode_cache_dir=os.getenv('DASHBOARD_TEMPLATES_CACHE_DIR', cls.bytecode_cache_dir),
+        )
+
+
+@dataclass
+class RefreshConfig:
+    # Intervalo entre ciclos de atualização das dashboards sem eventos (segundos);
+    # pipelines, deploys e merges disparam o refresh da categoria na hora
+    interval: int = 1800
+    # Renderizações/uploads simultâneos
+    concurrency: int = 2
+    # Atraso aleatório máximo somado ao horário de cada job (segundos)
+    jitter: int = 15
+    # Espera após um evento, para juntar rajadas (pipeline + deploy + merge) num único refresh
+    debounce: int = 30
+
+    @classmethod
+    def from_env(cls) -> 'RefreshConfig':
+        return cls(
+            interval=_env_int('DASHBOARD_REFRESH_INTERVAL', cls.interval),
+            concurrency=_env_int('DASHBOARD_REFRESH_CONCURRENCY', cls.concurrency),
+            jitter=_env_int('DASHBOARD_REFRESH_JITTER', cls.jitter),
+            debounce=_env_int('DASHBOARD_REFRESH_DEBOUNCE', cls.debounce),
+        )
+
+
+@dataclass
+class ImageConfig:
+    # 'png' (otimizado), 'webp' (lossless) ou 'raw' (como saiu do renderer)
+    format: str = 'png'
+    # Cores da paleta (o card é de cores chapadas); 0 mantém RGB
+    colors: int = 128
+    # Recorta o screenshot no .container em vez do viewport inteiro
+    clip: bool = True
+
+    @classmethod
+    def from_env(cls) -> 'ImageConfig':
+        return cls(
+            format=os.getenv('DASHBOARD_IMAGE_FORMAT', cls.format).strip().lower(),
+            colors=_env_int('DASHBOARD_IMAGE_COLORS', cls.colors),
+            clip=_env_bool('DASHBOARD_IMAGE_CLIP', cls.clip),
+        )
+
+
+@dataclass
+class MetricsConfig:
+    # Amostras guardadas por série; por padrão 24h de sample_interval (48 com o intervalo de 1800 s)
+    capacity: int = 24 * 3600 // RefreshConfig.interval
+    # Pontos mostrados em cada sparkline
+    sparkline_points: int = 24
+    # Uma amostra por intervalo (segundos): coletas no mesmo intervalo não mudam a série,
+    # então o card (e a RenderCache/edit_if_changed) só muda quando o intervalo vira
+    sample_interval: int = RefreshConfig.interval
+    # Arquivo JSON para manter as séries entre reinícios ('' desativa)
+    snapshot_path: str = ''
+    snapshot_interval: int = 300
+
+    @classmethod
+    def from_env(cls) -> 'MetricsConfig':
+        sample_interval = _env_int('DASHBOARD_METRICS_INTERVAL',
+                                   _env_int('DASHBOARD_REFRESH_INTERVAL', cls.sample_interval))
+        capacity = max(2, 24 * 3600 // sample_interval) if sample_interval > 0 else cls.capacity
+        return cls(
+            capacity=_env_int('DASHBOARD_METRICS_CAPACITY', capacity),
+            sparkline_points=_env_int('DASHBOARD_METRICS_POINTS', cls.sparkline_points),
+            sample_interval=sample_interval,
+            snapshot_path=os.getenv('DASHBOARD_METRICS_SNAPSHOT', cls.snapshot_path),
+            snapshot_interval=_env_int('DASHBOARD_METRICS_SNAPSHOT_INTERVAL', cls.snapshot_interval),
+        )
+
+
+@dataclass
+class RenderWorkerConfig:
+    # Processos dedicados à renderização (0 renderiza no próprio processo do bot)
+    workers: int = 0
+    # Segundos até um job ser abandonado e o worker reiniciado
+    timeout: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> 'RenderWorkerConfig':
+        return cls(
+            workers=_env_int('DASHBOARD_RENDER_WORKERS', cls.workers),
+            timeout=_env_float('DASHBOARD_RENDER_TIMEOUT', cls.timeout),
+        )
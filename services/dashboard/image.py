@@ -0,0 +1,73 @@
+import asyncio
+from io import BytesIO
+from typing import Optional
+
+from PIL import Image
+
+from core.logger import getLogger
+from .config import ImageConfig
+
+logger = getLogger('dashboard:image')
+
+FORMATS = ('png', 'webp', 'raw')
+
+
+class ImageProcessor:
+    """
+    Post-processing of rendered dashboards before upload.
+
+    The card is made of flat colours, so it is quantised to a small palette
+    (without dithering) and re-encoded as an optimised PNG or a lossless WebP.
+    Input/output byte counters are kept for ``stats()``.
+    """
+
+    def __init__(self, config: Optional[ImageConfig] = None):
+        self.config = config or ImageConfig.from_env()
+        if self.config.format not in FORMATS:
+            logger.warning(f"Unknown DASHBOARD_IMAGE_FORMAT '{self.config.format}', using png")
+            self.config.format = 'png'
+        self.images = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    @property
+    def extension(self) -> str:
+        return 'webp' if self.config.format == 'webp' else 'png'
+
+    @property
+    def signature(self) -> str:
+        """Identifica a configuração, para compor a chave da RenderCache."""
+        return f'{self.config.format}:{self.config.colors}'
+
+    async def process(self, data: bytes) -> bytes:
+        if self.config.format == 'raw':
+            return data
+        output = await asyncio.to_thread(self._process, data)
+        self.images += 1
+        self.bytes_in += len(data)
+        self.bytes_out += len(output)
+        return output
+
+    def _process(self, data: bytes) -> bytes:
+        image = Image.open(BytesIO(data)).convert('RGB')
+
+        if self.config.colors:
+            image = image.quantize(colors=self.config.colors, method=Image.Quantize.FASTOCTREE,
+                                   dither=Image.Dither.NONE)
+
+        buffer = BytesIO()
+        if self.config.format == 'webp':
+            # WebP não guarda paleta; a quantização ainda reduz o que o encoder precisa comprimir
+            image.convert('RGB').save(buffer, format='WEBP', lossless=True, method=6)
+        else:
+            image.save(buffer, format='PNG', optimize=True)
+        return buffer.getvalue()
+
+    def stats(self) -> dict:
+        return {
+            'format': self.config.format,
+            'images': self.images,
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            'saved': round(1 - self.bytes_out / self.bytes_in, 3) if self.bytes_in else 0.0,
+        }
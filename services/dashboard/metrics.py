@@ -0,0 +1,158 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from core.logger import getLogger
+from .config import MetricsConfig
+
+logger = getLogger('dashboard:metrics')
+
+# (conta, região, cluster, service)
+SeriesKey = Tuple[str, str, str, str]
+
+CPU = 'cpu'
+MEMORY = 'memory'
+RUNNING = 'running'
+
+
+def series_key(aws_project) -> SeriesKey:
+    # A conta entra como hash da access key: o snapshot não guarda credenciais
+    account = hashlib.sha256(str(aws_project.aws_access_key).encode()).hexdigest()[:12]
+    return account, aws_project.aws_region, aws_project.cluster_name, aws_project.service_name
+
+
+class RingBuffer:
+    """Fixed-capacity (timestamp, value) series backed by two ``array('d')``; the oldest sample is overwritten."""
+
+    __slots__ = ('capacity', '_times', '_values', '_head', '_count')
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._times = array('d', bytes(8 * capacity))
+        self._values = array('d', bytes(8 * capacity))
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def last_time(self) -> Optional[float]:
+        return self._times[(self._head - 1) % self.capacity] if self._count else None
+
+    def append(self, timestamp: float, value: float):
+        self._times[self._head] = timestamp
+        self._values[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def _order(self) -> range:
+        start = (self._head - self._count) % self.capacity
+        return range(start, start + self._count)
+
+    def values(self, last: Optional[int] = None) -> List[float]:
+        """Values in chronological order (only the `last` N when given)."""
+        indexes = self._order()
+        if last is not None:
+            indexes = indexes[-last:] if last else range(0)
+        return [self._values[i % self.capacity] for i in indexes]
+
+    def to_dict(self) -> dict:
+        indexes = self._order()
+        return {
+            't': [self._times[i % self.capacity] for i in indexes],
+            'v': [self._values[i % self.capacity] for i in indexes],
+        }
+
+    @classmethod
+    def from_dict(cls, capacity: int, data: dict) -> 'RingBuffer':
+        buffer = cls(capacity)
+        for timestamp, value in zip(data.get('t', []), data.get('v', [])):
+            buffer.append(timestamp, value)
+        return buffer
+
+
+class MetricStore:
+    """
+    In-memory time series of ECS/CloudWatch samples, one RingBuffer per
+    (account, region, cluster, service, metric). Filled by the status poller and
+    read by the dashboards, so sparklines cost no extra AWS calls. Keeps at most
+    one sample per ``sample_interval`` bucket, so a dashboard refreshed twice in
+    the same bucket renders the same card. Optionally snapshotted to a JSON file
+    (atomically) every ``snapshot_interval`` seconds and reloaded on start.
+    """
+
+    def __init__(self, config: Optional[MetricsConfig] = None):
+        self.config = config or MetricsConfig.from_env()
+        self._series: Dict[Tuple[SeriesKey, str], RingBuffer] = {}
+        self._last_snapshot = time.monotonic()
+        if self.config.snapshot_path:
+            self.load()
+
+    def record(self, key: SeriesKey, samples: Dict[str, float], timestamp: Optional[float] = None):
+        timestamp = timestamp or time.time()
+        bucket = self._bucket(timestamp)
+        for metric, value in samples.items():
+            if value is None:
+                continue  # sem datapoint no CloudWatch: a série fica sem o ponto, não cai a zero
+            buffer = self._series.get((key, metric))
+            if buffer is None:
+                buffer = self._series[(key, metric)] = RingBuffer(self.config.capacity)
+            elif bucket is not None and len(buffer) and self._bucket(buffer.last_time) >= bucket:
+                continue  # já há amostra neste intervalo
+            buffer.append(timestamp, float(value))
+
+    def _bucket(self, timestamp: float) -> Optional[int]:
+        # sample_interval 0 guarda todas as amostras
+        if not self.config.sample_interval:
+            return None
+        return int(timestamp // self.config.sample_interval)
+
+    def series(self, key: SeriesKey, metric: str, last: Optional[int] = None) -> Tuple[float, ...]:
+        buffer = self._series.get((key, metric))
+        if buffer is None:
+            return ()
+        return tuple(buffer.values(self.config.sparkline_points if last is None else last))
+
+    async def maybe_snapshot(self):
+        if not self.config.snapshot_path:
+            return
+        if time.monotonic() - self._last_snapshot < self.config.snapshot_interval:
+            return
+        self._last_snapshot = time.monotonic()
+        await asyncio.to_thread(self.snapshot)
+
+    def snapshot(self):
+        if not self.config.snapshot_path:
+            return
+        data = {
+            '|'.join((*key, metric)): buffer.to_dict()
+            for (key, metric), buffer in list(self._series.items())
+        }
+        tmp_path = self.config.snapshot_path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.config.snapshot_path)
+        except OSError as e:
+            logger.warning(f"Error writing metrics snapshot: {e}")
+
+    def load(self):
+        try:
+            with open(self.config.snapshot_path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Error reading metrics snapshot: {e}")
+            return
+
+        for name, series in data.items():
+            *key, metric = name.split('|')
+            if len(key) == 4:
+                self._series[(tuple(key), metric)] = RingBuffer.from_dict(self.config.capacity, series)
+        logger.info(f"Loaded {len(self._series)} metric series from {self.config.snapshot_path}")
@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class EnvironmentStatus:
+    """Uma linha do card: ambiente, data da última atualização e emoji de status."""
+    environment_name: str
+    last_update: str
+    service_status: str
+    # Séries recentes para as sparklines (mais antiga primeiro); vazias quando não há amostras
+    cpu: Tuple[float, ...] = ()
+    memory: Tuple[float, ...] = ()
+    running: Tuple[float, ...] = ()
+
+    @property
+    def has_metrics(self) -> bool:
+        return len(self.cpu) > 1 or len(self.memory) > 1 or len(self.running) > 1
+
+
+@dataclass(frozen=True)
+class ProjectStatus:
+    """Um projeto da categoria e as linhas dos seus ambientes."""
+    project_name: str
+    environments: Tuple[EnvironmentStatus, ...] = ()
+
+
+@dataclass(frozen=True)
+class DashboardCard:
+    """
+    Tudo o que é desenhado na dashboard de uma categoria, independente do backend:
+    todos os projetos da categoria, cada um com seus ambientes, numa única imagem.
+    """
+    project_icon: str
+    project_name: str
+    updated_at: str
+    projects: Tuple[ProjectStatus, ...] = ()
+
+    @property
+    def composite(self) -> bool:
+        # Com um só projeto o título (a categoria) basta; com vários, cada seção ganha um cabeçalho
+        return len(self.projects) > 1
+
+
+def sparkline_points(values, width: float, height: float, maximum: Optional[float] = None) -> List[Tuple[float, float]]:
+    """
+    Pontos (x, y) de uma sparkline dentro de uma caixa width x height, com y=0 no topo.
+    `maximum` fixa a escala (ex.: 100 para percentuais); sem ele, usa o maior valor da série.
+    """
+    if len(values) < 2:
+        return []
+    top = maximum if maximum else max(max(values), 1)
+    step = width / (len(values) - 1)
+    return [
+        (round(index * step, 1), round(height - min(value, top) / top * height, 1))
+        for index, value in enumerate(values)
+    ]
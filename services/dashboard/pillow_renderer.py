@@ -0,0 +1,346 @@
+import asyncio
+import os
+import threading
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+from core.emoji import status_emoji
+from core.logger import getLogger
+from .config import RendererConfig
+from .model import DashboardCard, EnvironmentStatus, ProjectStatus, sparkline_points
+from .renderer import DashboardRenderer, card_key
+from .tiles import TileCache, tile_key
+
+logger = getLogger('dashboard:pillow')
+
+# Mesmas medidas de templates/overview.html (viewport 500x300, container 20px + card 15px)
+WIDTH, HEIGHT = 500, 300
+LEFT, RIGHT = 35, WIDTH - 35
+TITLE_TOP = 25
+CONTENT_TOP = 63
+ROW_HEIGHT = 18
+ROW_STEP = 27
+HEAD_STEP = 22          # cabeçalho de cada projeto (só na dashboard composta)
+PROJECT_GAP = 10
+FOOTER_CENTER = 278
+FOOTER_MARGIN = HEIGHT - FOOTER_CENTER
+SPARKLINE_WIDTH, SPARKLINE_HEIGHT = 60, 16
+
+BACKGROUND = (255, 255, 255)
+TEXT_COLOR = (51, 51, 51)          # #333
+MUTED_COLOR = (127, 140, 141)      # #7f8c8d
+HEAD_COLOR = (85, 85, 85)          # #555
+DIVIDER_COLOR = (224, 224, 224)    # rgba(0,0,0,0.12) sobre branco
+CPU_COLOR = (52, 152, 219)         # #3498db
+MEMORY_COLOR = (155, 89, 182)      # #9b59b6
+RUNNING_COLOR = (46, 204, 113)     # #2ecc71
+
+REGULAR_FONTS = (
+    '/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf',
+    '/usr/share/fonts/truetype/msttcorefonts/Arial.ttf',
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+    '/Library/Fonts/Arial.ttf',
+    'C:/Windows/Fonts/arial.ttf',
+)
+BOLD_FONTS = (
+    '/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf',
+    '/usr/share/fonts/truetype/msttcorefonts/Arial_Bold.ttf',
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
+    '/Library/Fonts/Arial Bold.ttf',
+    'C:/Windows/Fonts/arialbd.ttf',
+)
+EMOJI_FONTS = (
+    '/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf',
+    '/usr/share/fonts/noto/NotoColorEmoji.ttf',
+)
+
+# Cores dos emojis desenhados quando não há fonte de emoji (paleta do Twemoji)
+CIRCLE_EMOJI = {
+    '🟢': (120, 177, 89),
+    '🔴': (221, 46, 68),
+    '🟡': (253, 203, 88),
+    '🟠': (244, 144, 12),
+    '🔵': (85, 172, 238),
+    '⚪': (230, 231, 232),
+    '⚫': (49, 55, 61),
+}
+PRELOADED_EMOJI = ('🚀', '⚠', '❌', '✅', *status_emoji.values(), *CIRCLE_EMOJI)
+
+# Emojis são desenhados em 4x e reduzidos, para ter antialiasing
+SUPERSAMPLE = 4
+# Tamanho em que as fontes de emoji coloridas (bitmap) são rasterizadas
+EMOJI_BITMAP_SIZE = 109
+
+
+def _first_existing(configured: str, candidates: Tuple[str, ...]) -> Optional[str]:
+    if configured:
+        return configured
+    return next((path for path in candidates if os.path.exists(path)), None)
+
+
+def _load_font(path: Optional[str], size: int) -> ImageFont.FreeTypeFont:
+    if path:
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError as e:
+            logger.warning(f"Could not load font {path}: {e}")
+    return ImageFont.load_default(size)
+
+
+def _is_emoji(char: str) -> bool:
+    code = ord(char)
+    return code >= 0x1F000 or 0x2600 <= code <= 0x27BF or 0x2B00 <= code <= 0x2BFF
+
+
+def _runs(text: str) -> List[Tuple[bool, str]]:
+    """Splits text into (is_emoji, segment) runs, dropping variation selectors and ZWJs."""
+    runs = []
+    for char in text:
+        if char in '\ufe0f\u200d':
+            continue
+        emoji = _is_emoji(char)
+        if emoji or not runs or runs[-1][0]:
+            runs.append((emoji, char))
+        else:
+            runs[-1] = (False, runs[-1][1] + char)
+    return runs
+
+
+class EmojiAtlas:
+    """
+    Emoji glyphs rasterized once per (emoji, size) and reused as RGBA stamps.
+
+    Uses a color emoji font when one is available; otherwise the status emojis
+    the dashboard uses are drawn from primitives (circles, cross, warning sign,
+    rocket) and anything else becomes a neutral dot.
+    """
+
+    def __init__(self, font_path: Optional[str] = None):
+        self._glyphs: Dict[Tuple[str, int], Image.Image] = {}
+        self._font = None
+        if font_path:
+            try:
+                self._font = ImageFont.truetype(font_path, EMOJI_BITMAP_SIZE)
+            except OSError as e:
+                logger.warning(f"Could not load emoji font {font_path}: {e}")
+
+    def preload(self, emojis, sizes):
+        for size in sizes:
+            for emoji in emojis:
+                self.get(emoji, size)
+
+    def get(self, emoji: str, size: int) -> Image.Image:
+        glyph = self._glyphs.get((emoji, size))
+        if glyph is None:
+            glyph = self._from_font(emoji, size) or self._draw(emoji, size)
+            self._glyphs[(emoji, size)] = glyph
+        return glyph
+
+    def _from_font(self, emoji: str, size: int) -> Optional[Image.Image]:
+        if self._font is None:
+            return None
+        canvas = Image.new('RGBA', (EMOJI_BITMAP_SIZE * 2, EMOJI_BITMAP_SIZE * 2))
+        ImageDraw.Draw(canvas).text((0, 0), emoji, font=self._font, embedded_color=True)
+        bbox = canvas.getbbox()
+        if bbox is None:
+            return None
+        return canvas.crop(bbox).resize((size, size), Image.LANCZOS)
+
+    def _draw(self, emoji: str, size: int) -> Image.Image:
+        s = size * SUPERSAMPLE
+        canvas = Image.new('RGBA', (s, s))
+        draw = ImageDraw.Draw(canvas)
+
+        if emoji in CIRCLE_EMOJI:
+            draw.ellipse((s * .06, s * .06, s * .94, s * .94), fill=CIRCLE_EMOJI[emoji])
+        elif emoji == '❌':
+            width = round(s * .16)
+            draw.line((s * .2, s * .2, s * .8, s * .8), fill=(221, 46, 68), width=width)
+            draw.line((s * .8, s * .2, s * .2, s * .8), fill=(221, 46, 68), width=width)
+        elif emoji == '⚠':
+            draw.polygon(((s * .5, s * .06), (s * .96, s * .9), (s * .04, s * .9)), fill=(255, 204, 77))
+            draw.rectangle((s * .45, s * .32, s * .55, s * .64), fill=(35, 31, 32))
+            draw.ellipse((s * .44, s * .7, s * .56, s * .82), fill=(35, 31, 32))
+        elif emoji == '✅':
+            draw.rounded_rectangle((s * .04, s * .04, s * .96, s * .96), radius=s * .16, fill=(119, 178, 85))
+            draw.line(((s * .24, s * .52), (s * .42, s * .7), (s * .76, s * .3)), fill='white', width=round(s * .12))
+        elif emoji == '🚀':
+            draw.polygon(((s * .3, s * .62), (s * .16, s * .86), (s * .38, s * .78)), fill=(221, 46, 68))
+            draw.polygon(((s * .7, s * .62), (s * .84, s * .86), (s * .62, s * .78)), fill=(221, 46, 68))
+            draw.polygon(((s * .42, s * .8), (s * .5, s * .98), (s * .58, s * .8)), fill=(244, 144, 12))
+            draw.polygon(((s * .5, s * .02), (s * .66, s * .22), (s * .66, s * .8), (s * .34, s * .8), (s * .34, s * .22)),
+                         fill=(204, 214, 221))
+            draw.ellipse((s * .42, s * .3, s * .58, s * .46), fill=(85, 172, 238))
+        else:
+            draw.ellipse((s * .2, s * .2, s * .8, s * .8), fill=(153, 170, 181))
+
+        return canvas.resize((size, size), Image.LANCZOS)
+
+
+class PillowRenderer(DashboardRenderer):
+    """
+    Draws the overview card (templates/overview.html + partials/project-info.html)
+    directly with Pillow: no browser, a few milliseconds and a few MB per image.
+    Fonts and emoji glyphs are loaded once, when the renderer is created, and
+    the card is composited from cached tiles (see TileCache).
+    """
+
+    name = 'pillow'
+
+    def __init__(self, config: Optional[RendererConfig] = None):
+        config = config or RendererConfig.from_env()
+        regular = _first_existing(config.font_path, REGULAR_FONTS)
+        bold = _first_existing(config.bold_font_path, BOLD_FONTS) or regular
+
+        self.title_font = _load_font(bold, 18)
+        self.row_font = _load_font(regular, 16)
+        self.head_font = _load_font(bold, 16)
+        self.small_font = _load_font(regular, 12)
+
+        self.emoji = EmojiAtlas(_first_existing(config.emoji_font_path, EMOJI_FONTS))
+        self.emoji.preload(PRELOADED_EMOJI, (24, 16, 12))
+
+        self.tiles = TileCache(config.tile_cache_mb)
+
+        # FreeType não é thread-safe; as renderizações rodam fora do event loop, uma por vez
+        self._lock = threading.Lock()
+
+    def cache_key(self, card: DashboardCard) -> str:
+        return card_key(self.name, card)
+
+    async def render(self, card: DashboardCard) -> bytes:
+        return await asyncio.to_thread(self.draw, card)
+
+    def height(self, card: DashboardCard) -> int:
+        """Like the card's min-height: 300px, growing with the number of projects/environments."""
+        content = sum(len(project.environments) * ROW_STEP for project in card.projects)
+        if card.composite:
+            content += len(card.projects) * HEAD_STEP + (len(card.projects) - 1) * PROJECT_GAP
+        return max(HEIGHT, CONTENT_TOP + content + 2 * FOOTER_MARGIN)
+
+    def draw(self, card: DashboardCard) -> bytes:
+        with self._lock:
+            height = self.height(card)
+            image = Image.new('RGB', (WIDTH, height), BACKGROUND)
+
+            # Cada parte do card é um tile em cache, pelo que mostra: quando um só ambiente
+            # muda, só a linha dele é desenhada de novo; o resto é colado
+            image.paste(self._cached(('header', card.project_icon, card.project_name, card.updated_at),
+                                     CONTENT_TOP, lambda tile, draw: self._header(tile, draw, card)), (0, 0))
+
+            # Uma seção por projeto; dentro dela, uma linha por ambiente separadas por uma borda tracejada
+            top = CONTENT_TOP
+            for project_index, project in enumerate(card.projects):
+                if project_index:
+                    top += PROJECT_GAP
+                if card.composite:
+                    image.paste(self._cached(('project', project.project_name), HEAD_STEP,
+                                             lambda tile, draw: self._project_head(tile, draw, project)), (0, top))
+                    top += HEAD_STEP
+
+                for index, environment in enumerate(project.environments):
+                    divider = index < len(project.environments) - 1
+                    image.paste(self._cached(('environment', environment, divider), ROW_STEP,
+                                             lambda tile, draw: self._environment_row(tile, draw, environment, divider)),
+                                (0, top))
+                    top += ROW_STEP
+
+            image.paste(self._cached(('footer',), 2 * FOOTER_MARGIN, self._footer), (0, height - 2 * FOOTER_MARGIN))
+
+            # Compressão leve: com o composite barato, o encode vira o custo principal, e o
+            # ImageProcessor recomprime a imagem antes do upload (exceto DASHBOARD_IMAGE_FORMAT=raw)
+            buffer = BytesIO()
+            image.save(buffer, format='PNG', compress_level=1)
+            return buffer.getvalue()
+
+    def _cached(self, parts: tuple, height: int, paint) -> Image.Image:
+        def draw_tile() -> Image.Image:
+            tile = Image.new('RGB', (WIDTH, height), BACKGROUND)
+            paint(tile, ImageDraw.Draw(tile))
+            return tile
+        return self.tiles.get_or_draw(tile_key(self.name, *parts), draw_tile)
+
+    def _header(self, image: Image.Image, draw: ImageDraw.ImageDraw, card: DashboardCard):
+        # Ícone + nome à esquerda, "Atualizado" à direita
+        updated = f"Atualizado: {card.updated_at}"
+        updated_width = self._text_width(updated, self.small_font)
+        self._text(image, draw, (RIGHT - updated_width, TITLE_TOP + 7), updated, self.small_font, MUTED_COLOR)
+
+        icon = self.emoji.get(_runs(card.project_icon)[0][1], 24) if card.project_icon.strip() else None
+        name_x = LEFT
+        if icon is not None:
+            image.paste(icon, (LEFT, TITLE_TOP + 2), icon)
+            name_x += 24 + 8
+        name = self._fit(card.project_name, self.title_font, RIGHT - updated_width - 12 - name_x)
+        self._text(image, draw, (name_x, TITLE_TOP + 14), name, self.title_font, TEXT_COLOR)
+
+    def _project_head(self, image: Image.Image, draw: ImageDraw.ImageDraw, project: ProjectStatus):
+        name = self._fit(project.project_name, self.head_font, RIGHT - LEFT)
+        self._text(image, draw, (LEFT, HEAD_STEP // 2), name, self.head_font, HEAD_COLOR)
+
+    def _footer(self, image: Image.Image, draw: ImageDraw.ImageDraw):
+        footer = "Status atual"
+        self._text(image, draw, ((WIDTH - self._text_width(footer, self.small_font)) // 2, FOOTER_MARGIN),
+                   footer, self.small_font, MUTED_COLOR)
+
+    def stats(self) -> dict:
+        return self.tiles.stats()
+
+    def _text_width(self, text: str, font: ImageFont.FreeTypeFont) -> int:
+        width = 0
+        for emoji, segment in _runs(text):
+            width += font.size if emoji else font.getlength(segment)
+        return round(width)
+
+    def _fit(self, text: str, font: ImageFont.FreeTypeFont, max_width: int) -> str:
+        if self._text_width(text, font) <= max_width:
+            return text
+        while text and self._text_width(text + '…', font) > max_width:
+            text = text[:-1]
+        return text + '…'
+
+    def _text(self, image: Image.Image, draw: ImageDraw.ImageDraw, position, text: str,
+              font: ImageFont.FreeTypeFont, color):
+        """Draws `text` vertically centered on position[1], stamping emoji glyphs inline."""
+        x, center = position
+        for emoji, segment in _runs(text):
+            if emoji:
+                glyph = self.emoji.get(segment, font.size)
+                image.paste(glyph, (round(x), round(center - font.size / 2)), glyph)
+                x += font.size
+            else:
+                draw.text((x, center), segment, font=font, fill=color, anchor='lm')
+                x += font.getlength(segment)
+
+    def _environment_row(self, image: Image.Image, draw: ImageDraw.ImageDraw, environment: EnvironmentStatus,
+                         divider: bool):
+        center = 4 + ROW_HEIGHT // 2
+        status = f"({environment.last_update}) {environment.service_status}"
+        status_width = self._text_width(status, self.row_font)
+        self._text(image, draw, (RIGHT - status_width, center), status, self.row_font, MUTED_COLOR)
+
+        used_width = status_width
+        if environment.has_metrics:
+            used_width += SPARKLINE_WIDTH + 8
+            self._sparklines(draw, environment, RIGHT - used_width, center - SPARKLINE_HEIGHT // 2)
+
+        label = self._fit(environment.environment_name, self.row_font, RIGHT - LEFT - used_width - 12)
+        self._text(image, draw, (LEFT, center), label, self.row_font, MUTED_COLOR)
+
+        if divider:
+            self._dashed_line(draw, 4 + ROW_HEIGHT + 4)
+
+    def _sparklines(self, draw: ImageDraw.ImageDraw, environment: EnvironmentStatus, left: int, top: int):
+        # Mesma ordem do SVG do template: tasks por baixo, CPU por cima
+        for values, maximum, color in ((environment.running, None, RUNNING_COLOR),
+                                       (environment.memory, 100, MEMORY_COLOR),
+                                       (environment.cpu, 100, CPU_COLOR)):
+            points = sparkline_points(values, SPARKLINE_WIDTH, SPARKLINE_HEIGHT, maximum)
+            if points:
+                draw.line([(left + x, top + y) for x, y in points], fill=color, width=1, joint='curve')
+
+    def _dashed_line(self, draw: ImageDraw.ImageDraw, y: int, dash: int = 3):
+        for x in range(LEFT, RIGHT, dash * 2):
+            draw.line((x, y, min(x + dash - 1, RIGHT), y), fill=DIVIDER_COLOR)
@@ -0,0 +1,154 @@
+import asyncio
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from core.logger import getLogger
+from .config import RenderCacheConfig
+
+logger = getLogger('dashboard:render_cache')
+
+# Extensões das entradas em disco (uma por formato de imagem); todas contam para o limite
+CACHE_EXTENSIONS = ('png', 'webp')
+
+
+def render_key(html: str) -> str:
+    return hashlib.sha256(html.encode('utf-8')).hexdigest()
+
+
+class RenderCache:
+    """
+    Rendered dashboard images keyed by the hash of their final HTML.
+
+    An in-memory LRU capped by total bytes, optionally backed by a directory of
+    ``<key>.<extension>`` files (the format the images are encoded in) with its
+    own size cap (oldest files are evicted first).
+    Disk reads and writes run on a worker thread, and the directory is only
+    rescanned when the running total of written bytes passes the cap.
+    Hit/miss counters are kept for ``stats()``.
+    """
+
+    def __init__(self, config: Optional[RenderCacheConfig] = None, extension: str = 'png'):
+        self.config = config or RenderCacheConfig.from_env()
+        self.extension = extension
+        self._entries: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Bytes em disco desde o último scan (None: ainda não medido)
+        self._disk_bytes: Optional[int] = None
+        self._disk_lock = threading.Lock()
+
+        if self.config.directory:
+            os.makedirs(self.config.directory, exist_ok=True)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+        data = await asyncio.to_thread(self._read_disk, key) if self.config.directory else None
+        if data is not None:
+            self.disk_hits += 1
+            self._remember(key, data)
+            return data
+
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, data: bytes):
+        self._remember(key, data)
+        if self.config.directory:
+            await asyncio.to_thread(self._write_disk, key, data)
+
+    def _remember(self, key: str, data: bytes):
+        max_bytes = self.config.max_memory_mb * 1024 * 1024
+        if len(data) > max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous)
+
+        self._entries[key] = data
+        self._bytes += len(data)
+
+        while self._bytes > max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.config.directory, f'{key}.{self.extension}')
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if not self.config.directory:
+            return None
+        try:
+            with open(self._path(key), 'rb') as f:
+                data = f.read()
+            # Mantém a ordem de remoção por mtime próxima de uma LRU
+            os.utime(self._path(key))
+            return data
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Error reading cached render {key}: {e}")
+            return None
+
+    def _write_disk(self, key: str, data: bytes):
+        if not self.config.directory:
+            return
+        try:
+            tmp_path = self._path(key) + '.tmp'
+            with self._disk_lock:
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, self._path(key))
+                # O scan do diretório só roda quando a soma estimada passa do limite
+                if self._disk_bytes is None or self._disk_bytes + len(data) > self.config.max_disk_mb * 1024 * 1024:
+                    self._trim_disk()
+                else:
+                    self._disk_bytes += len(data)
+        except OSError as e:
+            logger.warning(f"Error writing cached render {key}: {e}")
+
+    def _trim_disk(self):
+        max_bytes = self.config.max_disk_mb * 1024 * 1024
+        files = []
+        total = 0
+        with os.scandir(self.config.directory) as entries:
+            for entry in entries:
+                if entry.name.rpartition('.')[2] in CACHE_EXTENSIONS and entry.is_file():
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+
+        for _, size, path in sorted(files):
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                self.evictions += 1
+            except OSError:
+                pass
+        self._disk_bytes = total
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round((self.hits + self.disk_hits) / lookups, 3) if lookups else 0.0,
+        }
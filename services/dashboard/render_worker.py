@@ -0,0 +1,205 @@
+"""
+Render worker process: ``python -m services.dashboard.render_worker``.
+
+Reads framed pickles from stdin — first the (RendererConfig, ImageConfig) pair,
+then one DashboardCard per job, ``None`` to stop — and answers each job on
+stdout with ``(True, image_bytes)`` or ``(False, error)``. The image is already
+quantised and encoded by ImageProcessor, so that CPU-heavy step also stays out
+of the bot process. Started and supervised by ProcessRenderer.
+"""
+import asyncio
+import os
+import pickle
+import signal
+import struct
+import sys
+from typing import List, Optional
+
+from core.logger import getLogger
+from .config import ImageConfig, RendererConfig, RenderWorkerConfig
+from .image import ImageProcessor
+from .model import DashboardCard
+from .renderer import DashboardRenderer, create_renderer, project_root
+
+logger = getLogger('dashboard:render_worker')
+
+HEADER = struct.Struct('>I')
+
+
+class RenderWorkerError(RuntimeError):
+    """The render worker failed the job or died while rendering it."""
+
+
+def _frame(value) -> bytes:
+    data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    return HEADER.pack(len(data)) + data
+
+
+def _read_frame(stream):
+    header = stream.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise EOFError
+    return pickle.loads(stream.read(HEADER.unpack(header)[0]))
+
+
+def _write_frame(stream, value):
+    stream.write(_frame(value))
+    stream.flush()
+
+
+async def _serve(requests, responses):
+    config, image_config = _read_frame(requests)
+    renderer = create_renderer(config, image_config, RenderWorkerConfig(workers=0))
+    processor = ImageProcessor(image_config)
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            try:
+                card = await loop.run_in_executor(None, _read_frame, requests)
+            except EOFError:
+                break  # o bot fechou o pipe (ou morreu)
+            if card is None:
+                break
+            try:
+                _write_frame(responses, (True, await processor.process(await renderer.render(card))))
+            except Exception as e:
+                _write_frame(responses, (False, f'{type(e).__name__}: {e}'))
+    finally:
+        await renderer.close()
+
+
+def main():
+    # Ctrl+C chega ao grupo todo; quem encerra o worker é o processo do bot
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # O stdout fica reservado às respostas; prints/logs de terceiros vão para o stderr
+    responses = os.fdopen(os.dup(sys.stdout.fileno()), 'wb')
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    asyncio.run(_serve(sys.stdin.buffer, responses))
+
+
+class RenderWorker:
+    """One render process and the pipes to it. Used by one job at a time."""
+
+    def __init__(self, index: int, config: RendererConfig, image_config: ImageConfig):
+        self.index = index
+        self.config = config
+        self.image_config = image_config
+        self.process: Optional[asyncio.subprocess.Process] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    async def start(self):
+        self.process = await asyncio.create_subprocess_exec(
+            sys.executable, '-m', 'services.dashboard.render_worker',
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            cwd=project_root,
+            # Grupo próprio: matar o worker leva junto o driver do Playwright e o Chromium
+            start_new_session=True
+        )
+        await self._send((self.config, self.image_config))
+        logger.info(f"Render worker {self.index} started (pid {self.process.pid})")
+
+    async def _send(self, value):
+        self.process.stdin.write(_frame(value))
+        await self.process.stdin.drain()
+
+    async def _receive(self):
+        header = await self.process.stdout.readexactly(HEADER.size)
+        return pickle.loads(await self.process.stdout.readexactly(HEADER.unpack(header)[0]))
+
+    async def call(self, card: DashboardCard, timeout: float) -> bytes:
+        """Sends the card and waits up to `timeout` seconds for the image."""
+        if not self.alive:
+            await self.stop(kill=True)
+            await self.start()
+        try:
+            await self._send(card)
+            ok, payload = await asyncio.wait_for(self._receive(), timeout)
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            await self.stop(kill=True)
+            raise RenderWorkerError(f"render worker {self.index} died: {e!r}") from e
+        if not ok:
+            raise RenderWorkerError(payload)
+        return payload
+
+    async def stop(self, kill: bool = False):
+        if self.process is None:
+            return
+        process, self.process = self.process, None
+        if not kill and process.returncode is None:
+            try:
+                process.stdin.write(_frame(None))
+                await process.stdin.drain()
+                await asyncio.wait_for(process.wait(), 5)
+            except (asyncio.TimeoutError, ConnectionError):
+                pass
+        if process.returncode is None:
+            # Worker travado (ex.: Chromium pendurado)
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except (AttributeError, ProcessLookupError):
+                process.kill()
+            await process.wait()
+
+
+class ProcessRenderer(DashboardRenderer):
+    """
+    Runs another backend in ``workers`` separate processes, so HTML layout,
+    Chromium screenshots and PNG encoding do not compete with the gateway and
+    the webhook server for the bot's CPU and GIL.
+
+    Jobs (a picklable DashboardCard) go to the worker's stdin and the final
+    image (rendered, quantised and encoded per ``image_config``) comes back on
+    its stdout, hence ``processes_images``. A job that takes longer than ``timeout`` raises
+    asyncio.TimeoutError and its worker (with its Chromium) is killed; a dead
+    worker is respawned on its next job.
+    """
+
+    processes_images = True
+
+    def __init__(self, config: RendererConfig, image_config: ImageConfig,
+                 worker_config: Optional[RenderWorkerConfig] = None):
+        self.worker_config = worker_config or RenderWorkerConfig.from_env()
+        # Instância local só para cache_key (mesmas chaves do backend em processo); nunca renderiza
+        self.local = create_renderer(config, image_config, RenderWorkerConfig(workers=0))
+        self.name = self.local.name
+        self.workers: List[RenderWorker] = [
+            RenderWorker(index, config, image_config) for index in range(max(1, self.worker_config.workers))
+        ]
+        self._idle: asyncio.Queue = asyncio.Queue()
+        for worker in self.workers:
+            self._idle.put_nowait(worker)
+        self.restarts = 0
+
+    def cache_key(self, card: DashboardCard) -> str:
+        return self.local.cache_key(card)
+
+    async def render(self, card: DashboardCard) -> bytes:
+        worker = await self._idle.get()
+        try:
+            return await worker.call(card, self.worker_config.timeout)
+        except (asyncio.TimeoutError, RenderWorkerError, asyncio.CancelledError) as e:
+            if isinstance(e, RenderWorkerError) and worker.alive:
+                raise  # erro do backend; o worker segue saudável
+            # Resposta pendente no pipe ou processo morto: só um worker novo é confiável
+            logger.warning(f"Restarting render worker {worker.index}: {type(e).__name__} {e}")
+            self.restarts += 1
+            await worker.stop(kill=True)
+            raise
+        finally:
+            self._idle.put_nowait(worker)
+
+    def stats(self) -> dict:
+        # Os contadores do backend ficam nos processos; aqui só os do supervisor
+        return {'workers': len(self.workers), 'restarts': self.restarts}
+
+    async def close(self):
+        await asyncio.gather(*(worker.stop() for worker in self.workers))
+        await self.local.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,251 @@
+import abc
+import hashlib
+import itertools
+import os
+import weakref
+from collections import OrderedDict
+from typing import Optional
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+from core.logger import getLogger
+from .config import ImageConfig, RendererConfig, RenderWorkerConfig, TemplateConfig
+from .model import DashboardCard, EnvironmentStatus, sparkline_points
+from .render_cache import render_key
+
+logger = getLogger('dashboard:renderer')
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+templatesPath = os.path.join(project_root, 'templates')
+
+# 'page': set_content do overview a cada renderização; 'live': página carregada uma vez e atualizada via evaluate
+PLAYWRIGHT_MODES = ('page', 'live')
+LIVE_RENDER_TIMEOUT_MS = 10000
+# HTMLs calculados pelo cache_key à espera do render do mesmo card (hits no RenderCache nunca os consomem)
+PENDING_HTML_LIMIT = 32
+
+
+def create_template_environment(config: Optional[TemplateConfig] = None) -> Environment:
+    config = config or TemplateConfig.from_env()
+    if config.bytecode_cache_dir:
+        os.makedirs(config.bytecode_cache_dir, exist_ok=True)
+    environment = Environment(
+        loader=FileSystemLoader(templatesPath),
+        bytecode_cache=FileSystemBytecodeCache(config.bytecode_cache_dir or None),
+        auto_reload=config.auto_reload,
+        autoescape=select_autoescape(['html'])
+    )
+    environment.filters['sparkline'] = svg_points
+    return environment
+
+
+def svg_points(values, width: float, height: float, maximum: Optional[float] = None) -> str:
+    """Filtro `sparkline`: série -> atributo `points` de uma <polyline> SVG."""
+    return ' '.join(f'{x},{y}' for x, y in sparkline_points(values, width, height, maximum))
+
+
+# Templates são compilados uma vez e reutilizados (o include do partial também)
+template_environment = create_template_environment()
+
+
+class DashboardRenderer(abc.ABC):
+    """
+    Turns a DashboardCard into PNG bytes.
+
+    ``cache_key`` must change whenever the output would change, so it can key
+    the RenderCache; ``stats`` reports backend counters for the logs; ``close``
+    releases whatever the backend keeps alive. Backends with
+    ``processes_images`` return bytes already passed through ImageProcessor.
+    Callers ask for ``cache_key`` before ``render`` of the same card, so a
+    backend may hand work done for the key over to the render.
+    """
+
+    name = 'base'
+    processes_images = False
+
+    @abc.abstractmethod
+    def cache_key(self, card: DashboardCard) -> str:
+        ...
+
+    @abc.abstractmethod
+    async def render(self, card: DashboardCard) -> bytes:
+        ...
+
+    def stats(self) -> dict:
+        return {}
+
+    async def close(self):
+        pass
+
+
+class PlaywrightRenderer(DashboardRenderer):
+    """
+    The HTML templates (overview + project-info partials) screenshotted on a pooled Chromium.
+
+    In ``live`` mode each pooled page loads templates/live.html once; renders
+    push the card through ``page.evaluate`` into ``window.renderDashboard`` and
+    wait for its ``body[data-rendered]`` signal, instead of re-parsing the whole
+    HTML and CSS with ``set_content`` every time. Either way the whole card is
+    screenshotted: tile caching is Pillow-only.
+    """
+
+    name = 'playwright'
+
+    def __init__(self, pool=None, clip_selector: Optional[str] = '.container', mode: str = 'page'):
+        # Import tardio: deploys com o backend Pillow não precisam do Playwright
+        from .browser_pool import BrowserPool
+        self.pool = pool or BrowserPool()
+        self.clip_selector = clip_selector
+        if mode not in PLAYWRIGHT_MODES:
+            logger.warning(f"Unknown DASHBOARD_PLAYWRIGHT_MODE '{mode}', using page")
+            mode = 'page'
+        self.mode = mode
+        # Página -> hash do live.html carregado nela (páginas substituídas pelo pool somem sozinhas)
+        self._live_pages: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+        self._tokens = itertools.count(1)
+        # Modo page: o template é renderizado uma vez por card, no cache_key, e reaproveitado no render
+        self._pending_html: 'OrderedDict[DashboardCard, str]' = OrderedDict()
+
+    def html(self, card: DashboardCard) -> str:
+        # Uma única renderização para a categoria inteira: o overview inclui o partial de cada ambiente
+        return template_environment.get_template('overview.html').render(
+            project_icon=card.project_icon,
+            project_name=card.project_name,
+            updated_at=card.updated_at,
+            projects=card.projects,
+            composite=card.composite,
+            progress_bar_value=0,  # Removido barra de progresso
+            resource_use="N/A",  # Removido uso de recursos
+            instances_count=0  # Removido contagem de instâncias
+        )
+
+    def live_html(self) -> str:
+        return template_environment.get_template('live.html').render()
+
+    def cache_key(self, card: DashboardCard) -> str:
+        if self.mode == 'live':
+            # A imagem depende do card e do live.html (que só muda com o template)
+            return card_key(f'{self.name}:live:{render_key(self.live_html())}', card)
+        html = self.html(card)
+        self._pending_html[card] = html
+        self._pending_html.move_to_end(card)
+        while len(self._pending_html) > PENDING_HTML_LIMIT:
+            self._pending_html.popitem(last=False)
+        return render_key(html)
+
+    async def render(self, card: DashboardCard) -> bytes:
+        if self.mode == 'live':
+            return await self._render_live(card)
+
+        html = self._pending_html.pop(card, None)
+        if html is None:
+            html = self.html(card)
+        async with self.pool.page() as page:
+            await page.set_content(html)
+            await page.set_viewport_size({"width": 500, "height": 300})
+            return await self._screenshot(page)
+
+    async def _render_live(self, card: DashboardCard) -> bytes:
+        html = self.live_html()
+        version = render_key(html)
+        async with self.pool.page() as page:
+            if self._live_pages.get(page) != version:
+                # Uma vez por página (ou quando o template muda, com DASHBOARD_TEMPLATES_AUTO_RELOAD)
+                await page.set_content(html)
+                self._live_pages[page] = version
+
+            token = str(next(self._tokens))
+            try:
+                await page.evaluate('([card, token]) => window.renderDashboard(card, token)',
+                                    [live_payload(card), token])
+                await page.wait_for_function('token => document.body.dataset.rendered === token',
+                                             arg=token, timeout=LIVE_RENDER_TIMEOUT_MS)
+            except Exception:
+                # Estado da página incerto: recarrega o template na próxima vez
+                self._live_pages.pop(page, None)
+                raise
+            return await self._screenshot(page)
+
+    async def _screenshot(self, page) -> bytes:
+        # Só o card, não o viewport inteiro (full_page: categorias com muitos projetos passam da dobra)
+        box = await page.locator(self.clip_selector).first.bounding_box() if self.clip_selector else None
+        if box:
+            return await page.screenshot(clip=box, full_page=True)
+        return await page.screenshot(full_page=True)
+
+    async def close(self):
+        await self.pool.close()
+
+
+def live_payload(card: DashboardCard) -> dict:
+    """The card as JSON for window.renderDashboard (sparklines already as SVG points, like the partial)."""
+    return {
+        'project_icon': card.project_icon,
+        'project_name': card.project_name,
+        'updated_at': card.updated_at,
+        'composite': card.composite,
+        'projects': [
+            {
+                'project_name': project.project_name,
+                'environments': [_environment_payload(environment) for environment in project.environments],
+            }
+            for project in card.projects
+        ],
+    }
+
+
+def _environment_payload(environment: EnvironmentStatus) -> dict:
+    sparklines = None
+    if environment.has_metrics:
+        sparklines = {
+            'running': svg_points(environment.running, 60, 16),
+            'memory': svg_points(environment.memory, 60, 16, 100),
+            'cpu': svg_points(environment.cpu, 60, 16, 100),
+        }
+    return {
+        'environment_name': environment.environment_name,
+        'last_update': environment.last_update,
+        'service_status': environment.service_status,
+        'sparklines': sparklines,
+    }
+
+
+def card_key(backend: str, card: DashboardCard) -> str:
+    """Cache key for backends that draw straight from the card data."""
+    return hashlib.sha256(f'{backend}:{card!r}'.encode('utf-8')).hexdigest()
+
+
+def create_renderer(config: Optional[RendererConfig] = None, image_config: Optional[ImageConfig] = None,
+                    worker_config: Optional[RenderWorkerConfig] = None) -> DashboardRenderer:
+    """
+    The backend chosen by DASHBOARD_RENDERER, run in worker processes when
+    DASHBOARD_RENDER_WORKERS > 0.
+
+    Pillow is the default: it composites cards from cached tiles
+    (DASHBOARD_TILE_CACHE_MB), so only the parts of a card that changed are
+    redrawn. The Playwright backend (opt-in, for the HTML templates) lays out
+    and screenshots the whole card on every render in both ``page`` and ``live``
+    mode; unchanged cards are served by the RenderCache before reaching either.
+    """
+    config = config or RendererConfig.from_env()
+    image_config = image_config or ImageConfig.from_env()
+    worker_config = worker_config or RenderWorkerConfig.from_env()
+
+    if worker_config.workers > 0:
+        from .render_worker import ProcessRenderer
+        renderer = ProcessRenderer(config, image_config, worker_config)
+        logger.info(f"Dashboard renderer: {renderer.name} in {worker_config.workers} worker process(es)")
+        return renderer
+
+    if config.backend == 'playwright':
+        renderer = PlaywrightRenderer(clip_selector='.container' if image_config.clip else None,
+                                      mode=config.playwright_mode)
+    else:
+        if config.backend != 'pillow':
+            logger.warning(f"Unknown DASHBOARD_RENDERER '{config.backend}', using pillow")
+        from .pillow_renderer import PillowRenderer
+        renderer = PillowRenderer(config)
+
+    logger.info(f"Dashboard renderer: {renderer.name}")
+    return renderer
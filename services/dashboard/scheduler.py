@@ -0,0 +1,145 @@
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional
+
+from core.logger import getLogger
+from .config import RefreshConfig
+
+logger = getLogger('dashboard:scheduler')
+
+# Fração do intervalo em que os jobs de um ciclo são espalhados; o resto é folga para renderizações lentas
+SPREAD = 0.8
+
+JobsFactory = Callable[[], Awaitable[List]]
+RefreshJob = Callable[[object], Awaitable[None]]
+
+
+class DashboardScheduler:
+    """
+    Periodic refresh of every dashboard, one job per dashboard thread.
+
+    Each cycle asks ``jobs()`` for the current list of jobs and spreads them over
+    the first ``SPREAD`` of the interval: job ``i`` of ``n`` starts at
+    ``i * SPREAD * interval / n`` plus up to ``jitter`` seconds, so uploads don't
+    arrive in a burst and slow renders have slack before the next cycle. At most
+    ``concurrency`` jobs run at once. A cycle that still runs past the start of
+    the next one makes the next cycle start late (right away), never skipped.
+
+    ``trigger(job)`` refreshes a single job out of band, ``debounce`` seconds
+    after the first trigger (later triggers in that window are folded in). Jobs
+    refreshed that way within the last interval are skipped by the next cycle.
+    """
+
+    def __init__(
+        self,
+        jobs: JobsFactory,
+        refresh: RefreshJob,
+        config: Optional[RefreshConfig] = None,
+        key: Callable[[object], Hashable] = None
+    ):
+        self.jobs = jobs
+        self.refresh = refresh
+        self.config = config or RefreshConfig.from_env()
+        self.key = key or (lambda job: job)
+        self._semaphore = asyncio.Semaphore(self.config.concurrency)
+        self._task: Optional[asyncio.Task] = None
+        self._triggered: Dict[Hashable, asyncio.Task] = {}
+        # Último refresh disparado por evento, por chave
+        self._last_refresh: Dict[Hashable, float] = {}
+        self.cycles = 0
+        self.late = 0
+        self.triggers = 0
+
+    def start(self, wait_until: Callable[[], Awaitable] = None):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop(wait_until))
+
+    def trigger(self, job):
+        key = self.key(job)
+        if key in self._triggered:
+            return
+        self.triggers += 1
+        self._triggered[key] = asyncio.create_task(self._run_triggered(key, job))
+
+    async def _run_triggered(self, key, job):
+        try:
+            await asyncio.sleep(self.config.debounce)
+        finally:
+            # Eventos que chegarem durante a renderização agendam outro refresh
+            self._triggered.pop(key, None)
+        async with self._semaphore:
+            await self._refresh(job, triggered=True)
+
+    async def stop(self):
+        for task in list(self._triggered.values()):
+            task.cancel()
+        self._triggered.clear()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _loop(self, wait_until):
+        if wait_until is not None:
+            await wait_until()
+
+        interval = self.config.interval
+        next_start = time.monotonic()
+        while True:
+            started = time.monotonic()
+            await self.run_cycle()
+            self.cycles += 1
+
+            next_start += interval
+            now = time.monotonic()
+            if now > next_start:
+                # Passou do horário do próximo ciclo: começa atrasado agora, e os seguintes contam daqui
+                self.late += 1
+                next_start = now
+                logger.warning(f"Dashboard refresh took {now - started:.1f}s (interval {interval}s); "
+                               f"starting the next cycle {now - started - interval:.1f}s late")
+
+            await asyncio.sleep(next_start - time.monotonic())
+
+    async def run_cycle(self):
+        try:
+            jobs = await self.jobs()
+        except Exception as e:
+            logger.error(f"Could not list dashboard jobs: {e}")
+            return
+
+        # Um job por chave (thread da dashboard), mesmo que a lista traga repetidos;
+        # dashboards atualizadas por evento dentro do intervalo ficam de fora
+        fresh_after = time.monotonic() - self.config.interval
+        unique = [
+            job for key, job in {self.key(job): job for job in jobs}.items()
+            if self._last_refresh.get(key, float('-inf')) < fresh_after
+        ]
+        if not unique:
+            return
+
+        slot = self.config.interval * SPREAD / len(unique)
+        started = time.monotonic()
+        await asyncio.gather(*(
+            self._run_job(job, started + index * slot + random.uniform(0, min(self.config.jitter, slot)))
+            for index, job in enumerate(unique)
+        ))
+        logger.info(f"Dashboard refresh: {len(unique)} job(s) in {time.monotonic() - started:.1f}s")
+
+    async def _run_job(self, job, at: float):
+        await asyncio.sleep(max(0.0, at - time.monotonic()))
+        async with self._semaphore:
+            await self._refresh(job)
+
+    async def _refresh(self, job, triggered: bool = False):
+        key = self.key(job)
+        try:
+            await self.refresh(job)
+            if triggered:
+                self._last_refresh[key] = time.monotonic()
+        except Exception as e:
+            logger.error(f"Error refreshing dashboard {key}: {e}")
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
+
+from botocore.config import Config as BotoConfig
+
+from core.aws_resource_manager import AWSResourceManager
+from core.logger import getLogger
+from .config import AWSStatusConfig
+from .metrics import CPU, MEMORY, RUNNING, MetricStore, series_key
+
+logger = getLogger('dashboard:status')
+
+
+class AWSStatusCollector:
+    """
+    Runs the blocking boto3 calls behind a dashboard (describe_services plus the
+    CloudWatch metrics) on a bounded thread pool, so the event loop keeps serving
+    the gateway and the webhook server while environments are queried in parallel.
+
+    One AWSResourceManager is kept per set of credentials/region (boto3 clients
+    are thread-safe; creating sessions is not, hence the lock). Every lookup is
+    bounded by ``timeout`` on the asyncio side and by botocore timeouts on the
+    thread side, so a stuck region neither stalls the dashboard nor pins a worker.
+
+    Each answer is also recorded in ``metrics`` (CPU, memory, running tasks),
+    which the dashboards read for their sparklines.
+    """
+
+    def __init__(self, config: Optional[AWSStatusConfig] = None, metrics: Optional[MetricStore] = None):
+        self.config = config or AWSStatusConfig.from_env()
+        self.metrics = metrics
+        self._executor = ThreadPoolExecutor(max_workers=self.config.workers, thread_name_prefix='dashboard-aws')
+        self._client_config = BotoConfig(
+            connect_timeout=min(5, self.config.timeout),
+            read_timeout=self.config.timeout,
+            retries={'max_attempts': 2}
+        )
+        self._managers: Dict[Tuple[str, str, str], AWSResourceManager] = {}
+        self._managers_lock = threading.Lock()
+
+    def _manager(self, aws_project) -> AWSResourceManager:
+        key = (aws_project.aws_access_key, aws_project.aws_secret_key, aws_project.aws_region)
+        with self._managers_lock:
+            manager = self._managers.get(key)
+            if manager is None:
+                manager = AWSResourceManager(*key, client_config=self._client_config)
+                self._managers[key] = manager
+            return manager
+
+    def _services_info(self, aws_projects) -> Dict[str, Optional[dict]]:
+        # Todos do mesmo cluster (e credenciais): um describe_services a cada 10 services
+        first = aws_projects[0]
+        return self._manager(first).get_services_info(
+            first.cluster_name,
+            [aws_project.service_name for aws_project in aws_projects]
+        )
+
+    async def services_info(self, aws_projects) -> List[Union[dict, None, BaseException]]:
+        """
+        ECS service status of many environments (a whole category) in one batched
+        fetch: environments are grouped per cluster, each cluster is queried once
+        (see AWSResourceManager.get_services_info) and clusters run in parallel.
+
+        Returns:
+            One entry per environment, in order: the service info, None when the
+            service was not found, or the exception its cluster raised
+            (asyncio.TimeoutError after ``timeout`` seconds)
+        """
+        clusters: Dict[Tuple[str, str, str, str], List[int]] = {}
+        for index, aws_project in enumerate(aws_projects):
+            key = (aws_project.aws_access_key, aws_project.aws_secret_key,
+                   aws_project.aws_region, aws_project.cluster_name)
+            clusters.setdefault(key, []).append(index)
+
+        loop = asyncio.get_running_loop()
+
+        async def fetch(indexes):
+            members = [aws_projects[index] for index in indexes]
+            future = loop.run_in_executor(self._executor, self._services_info, members)
+            try:
+                return await asyncio.wait_for(future, self.config.timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"AWS status of cluster {members[0].cluster_name} ({members[0].aws_region}) "
+                               f"timed out after {self.config.timeout}s")
+                raise
+
+        answers = await asyncio.gather(*(fetch(indexes) for indexes in clusters.values()), return_exceptions=True)
+
+        results: List[Union[dict, None, BaseException]] = [None] * len(aws_projects)
+        for indexes, answer in zip(clusters.values(), answers):
+            for index in indexes:
+                if isinstance(answer, BaseException):
+                    results[index] = answer
+                    continue
+                info = results[index] = answer.get(aws_projects[index].service_name)
+                if info and self.metrics is not None:
+                    self.metrics.record(series_key(aws_projects[index]), {
+                        CPU: info.get('cpu_usage'),
+                        MEMORY: info.get('memory_usage'),
+                        RUNNING: info.get('running_count'),
+                    })
+
+        if self.metrics is not None:
+            await self.metrics.maybe_snapshot()
+        return results
+
+    async def service_info(self, aws_project) -> Optional[dict]:
+        """
+        ECS service status of one environment (see AWSResourceManager.get_specific_service_info).
+
+        Raises:
+            asyncio.TimeoutError: The environment did not answer within ``timeout`` seconds
+        """
+        info, = await self.services_info([aws_project])
+        if isinstance(info, BaseException):
+            raise info
+        return info
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,66 @@
+import hashlib
+from collections import OrderedDict
+from typing import Callable
+
+from PIL import Image
+
+
+def tile_key(*parts) -> str:
+    return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+
+
+class TileCache:
+    """
+    Rendered dashboard tiles (header, project heads, one row per environment,
+    footer) keyed by the hash of what they show. An in-memory LRU of decoded
+    images capped by total pixel bytes, so a dashboard where one environment
+    changed costs one tile render plus a paste of the others.
+    """
+
+    def __init__(self, max_memory_mb: int = 8):
+        self.max_bytes = max_memory_mb * 1024 * 1024
+        self._entries: 'OrderedDict[str, Image.Image]' = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_draw(self, key: str, draw: Callable[[], Image.Image]) -> Image.Image:
+        tile = self._entries.get(key)
+        if tile is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return tile
+
+        self.misses += 1
+        tile = draw()
+        self._remember(key, tile)
+        return tile
+
+    def _remember(self, key: str, tile: Image.Image):
+        size = _image_bytes(tile)
+        if size > self.max_bytes:
+            return
+
+        self._entries[key] = tile
+        self._bytes += size
+
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= _image_bytes(evicted)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'tiles': len(self._entries),
+            'bytes': self._bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+def _image_bytes(image: Image.Image) -> int:
+    return image.width * image.height * len(image.getbands())
@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import discord
+
+# core.env lê WEBHOOK_PORT com int() na importação
+os.environ['WEBHOOK_PORT'] = os.environ.get('WEBHOOK_PORT') or '5000'
+
+from actions.project import ProjectActions
+from core.channel_index import dropChannelIndex
+from core.db.project import Project, projectFromCursor
+
+GUILD_ID = 1
+CATEGORY_ID = 1394305178265450000
+CHANNEL_ID = 1394305178265452575
+THREAD_ID = 1394305178265459999
+
+
+class RemoveProjectTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        # Project() usa gino.db no diretório atual
+        os.chdir(self.tmp.name)
+
+        self.category = mock.Mock(spec=discord.CategoryChannel, id=CATEGORY_ID, channels=[])
+        self.category.name = 'GROUP'
+        self.category.delete = mock.AsyncMock()
+
+        self.channel = mock.Mock(spec=discord.TextChannel, id=CHANNEL_ID, category_id=CATEGORY_ID)
+        self.channel.name = 'app'
+        self.channel.delete = mock.AsyncMock()
+
+        self.thread = mock.Mock(id=THREAD_ID, parent_id=42, archived=False)
+        self.thread.edit = mock.AsyncMock()
+
+        self.guild = mock.Mock(id=GUILD_ID, channels=[self.category, self.channel])
+        self.guild.get_thread = lambda thread_id: self.thread if thread_id == THREAD_ID else None
+        dropChannelIndex(GUILD_ID)
+
+        self.db = Project()
+        await self.db.initialize()
+        await self.db.set_project(7, 'app', 'GROUP', CHANNEL_ID, CATEGORY_ID, 'https://gitlab/app')
+        await self.db.set_thread(7, THREAD_ID)
+
+    async def asyncTearDown(self):
+        dropChannelIndex(GUILD_ID)
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    async def test_remove_uses_ids_stored_as_text(self):
+        row = await self.db.get_project(7)
+        project_row = projectFromCursor(row)
+        # As colunas são TEXT: o id volta como string
+        self.assertIsInstance(project_row.channel_id, str)
+
+        actions = ProjectActions(self.guild)
+        actions.project = project_row
+        actions.category_channel = self.category
+        actions.gitlab_project = mock.Mock(id=7)
+        actions.gitlab_project.hooks.list.return_value = []
+
+        await actions.remove()
+
+        self.channel.delete.assert_awaited_once()
+        self.category.delete.assert_awaited_once()
+        self.thread.edit.assert_awaited_once_with(archived=True, reason=None)
+        self.assertIsNone(await self.db.get_project(7))
+
+
+if __name__ == '__main__':
+    unittest.main()